@@ -0,0 +1,15 @@
+import multiprocessing
+import os
+
+# Gunicorn configuration of the web service, e.g. gunicorn -c deployment/gunicorn_conf.py src.examples.webapp.wsgi:app
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Requests mostly wait on the network, so each worker serves several of them in threads
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+keepalive = 5
+
+# Load the app once in the master so workers share its memory
+preload_app = True
\ No newline at end of file
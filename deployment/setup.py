@@ -11,6 +11,8 @@ setup(
     install_requires=[
         "requests",
         "beautifulsoup4",
+        "brotli",
+        "lxml",
         "protego",
         "validators",
         "huggingface_hub",
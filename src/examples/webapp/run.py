@@ -1,4 +1,5 @@
 # run.py
+import os
 from .src.app import FlaskApp
 from .src.router import Router
 from .src.services import Services
@@ -6,7 +7,13 @@ from .src.database import Database
 from .src.api.api_router import APIRouter
 from .src.api.api_services import APIServices
 
-if __name__ == '__main__':
+def create_app():
+    """
+    Create the Flask application with all routes registered.
+    
+    Returns:
+        Flask: The configured Flask application.
+    """
     flask_app = FlaskApp()
     app = flask_app.get_app()
     
@@ -16,4 +23,9 @@ if __name__ == '__main__':
     Router(app, services)
     APIRouter(app, api_services)
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    return app
+
+if __name__ == '__main__':
+    # Development server only, production deployments serve wsgi.app with gunicorn
+    app = create_app()
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv('FLASK_DEBUG') == '1')
\ No newline at end of file
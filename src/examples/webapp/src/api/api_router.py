@@ -1,4 +1,25 @@
-from flask import Blueprint, request, jsonify, url_for, make_response
+from flask import Blueprint, Response, request, url_for
+import json
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    _dumps = json.dumps
+
+def _json(obj, status=200, headers=None):
+    """
+    Build a JSON response without going through Flask's jsonify.
+    
+    Args:
+        obj: JSON serializable object
+        status: HTTP status code (default: 200)
+        headers: Optional dictionary of response headers
+        
+    Returns:
+        Response with the serialized object
+    """
+    return Response(_dumps(obj), status=status, mimetype='application/json', headers=headers)
 
 class APIRouter:
     """  
@@ -6,6 +27,12 @@ class APIRouter:
     endpoints for scanning websites for license information, generating
     summaries, and answering questions about license documents.
     """
+    # Seconds a client should wait before polling a running task again
+    RETRY_AFTER = 2
+
+    # Placeholder substituted with the task ID in precomputed task URLs
+    TASK_ID_PLACEHOLDER = '__TASK_ID__'
+
     def __init__(self, app, services):
         """
         Initialize the API router.
@@ -19,6 +46,7 @@ class APIRouter:
         self.api_bp = Blueprint('api', __name__)
         self.register_routes()
         self.app.register_blueprint(self.api_bp, url_prefix='/api')
+        self.task_url_templates = self._build_task_url_templates()
 
     def register_routes(self):
         """
@@ -44,13 +72,36 @@ class APIRouter:
                 return validation_error
             
             task = self.services.queue_scan_task(data)
-            task_url = url_for('api.api_scan_get', task_id=task.id, _external=True)
+            task_url = self._task_url('api.api_scan_get', task.id)
             
-            response = jsonify({
+            return _json({
                 'status': 'processing',
                 'task_id': task.id
-            })
-            return make_response(response, 202, {'Location': task_url})
+            }, 202, {'Location': task_url})
+
+        @self.api_bp.route('/scans:batch', methods=['POST'])
+        def api_scan_batch_create():
+            """
+            Process several website scan requests at once.
+            
+            Expects a JSON payload with a 'batches' key containing a list of
+            objects, each with a 'urls' key containing a list of website URLs.
+            Queues one scanning task per batch asynchronously.
+            
+            Returns:
+                JSON response with task IDs and status
+            """
+            data = request.get_json()
+            validation_error = self.services.validate_scan_batch_request(data)
+            if validation_error:
+                return validation_error
+
+            tasks = self.services.queue_scan_tasks(data['batches'])
+            
+            return _json({
+                'status': 'processing',
+                'task_ids': [task.id for task in tasks]
+            }, 202)
 
         @self.api_bp.route('/scans/<task_id>', methods=['GET'])
         def api_scan_get(task_id):
@@ -63,9 +114,14 @@ class APIRouter:
             Returns:
                 JSON response with task status and scan results if available
             """
+            # Completed results never change, so a client holding them is answered without loading them
+            if request.if_none_match.contains_weak(self._completed_scan_etag(task_id)):
+                return self._make_not_modified_scan_response(task_id)
+
             result = self.services.get_scan_task_result(task_id)
-            http_status = result.pop('http_status')
-            return make_response(jsonify(result), http_status)
+            if result['status'] == 'completed':
+                return self._make_streamed_scan_response(task_id, result)
+            return self._make_task_response(result)
 
         @self.api_bp.route('/summaries', methods=['POST'])
         def api_summary_create():
@@ -84,13 +140,12 @@ class APIRouter:
                 return validation_error
 
             task = self.services.queue_summary_task(data)
-            task_url = url_for('api.api_summary_get', task_id=task.id, _external=True)
+            task_url = self._task_url('api.api_summary_get', task.id)
             
-            response = jsonify({
+            return _json({
                 'status': 'processing',
                 'task_id': task.id
-            })
-            return make_response(response, 202, {'Location': task_url})
+            }, 202, {'Location': task_url})
 
         @self.api_bp.route('/summaries/<task_id>', methods=['GET'])
         def api_summary_get(task_id):
@@ -104,8 +159,7 @@ class APIRouter:
                 JSON response with task status and result if available
             """
             result = self.services.get_summary_task_result(task_id)
-            http_status = result.pop('http_status')
-            return make_response(jsonify(result), http_status)
+            return self._make_task_response(result)
 
         @self.api_bp.route('/answers', methods=['POST'])
         def api_answer_create():
@@ -124,13 +178,12 @@ class APIRouter:
                 return validation_error
 
             task = self.services.queue_question_task(data)
-            task_url = url_for('api.api_answer_get', task_id=task.id, _external=True)
+            task_url = self._task_url('api.api_answer_get', task.id)
             
-            response = jsonify({
+            return _json({
                 'status': 'processing',
                 'task_id': task.id
-            })
-            return make_response(response, 202, {'Location': task_url})
+            }, 202, {'Location': task_url})
 
         @self.api_bp.route('/answers/<task_id>', methods=['GET'])
         def api_answer_get(task_id):
@@ -144,5 +197,115 @@ class APIRouter:
                 JSON response with task status and answer if available
             """
             result = self.services.get_question_task_result(task_id)
-            http_status = result.pop('http_status')
-            return make_response(jsonify(result), http_status)
\ No newline at end of file
+            return self._make_task_response(result)
+
+    def _build_task_url_templates(self):
+        """
+        Build the URL paths of the task status endpoints once.
+        
+        Returns:
+            Dictionary mapping endpoint names to paths with a task ID placeholder
+        """
+        endpoints = ['api.api_scan_get', 'api.api_summary_get', 'api.api_answer_get']
+        with self.app.test_request_context():
+            return {
+                endpoint: url_for(endpoint, task_id=self.TASK_ID_PLACEHOLDER).lstrip('/')
+                for endpoint in endpoints
+            }
+
+    def _task_url(self, endpoint, task_id):
+        """
+        Get the external URL of a task status endpoint for the current request.
+        
+        Args:
+            endpoint: Name of the task status endpoint
+            task_id: ID of the task
+            
+        Returns:
+            Absolute URL of the task status endpoint
+        """
+        path = self.task_url_templates[endpoint].replace(self.TASK_ID_PLACEHOLDER, task_id)
+        return request.url_root + path
+
+    def _make_task_response(self, result):
+        """
+        Build the response of a task status request with caching headers.
+        
+        Finished results get a weak ETag so repeated polls are answered with
+        304 Not Modified, while responses of running tasks are not cached and
+        tell the client when to poll again.
+        
+        Args:
+            result: Dictionary with task status and 'http_status' code
+            
+        Returns:
+            Response with the task status as JSON
+        """
+        http_status = result.pop('http_status')
+        response = _json(result, http_status)
+        if http_status != 200:
+            response.headers['Cache-Control'] = 'no-store'
+            if http_status == 202:
+                response.headers['Retry-After'] = str(self.RETRY_AFTER)
+            return response
+
+        response.add_etag(weak=True)
+        response.headers['Cache-Control'] = 'private, max-age=5'
+        return response.make_conditional(request)
+
+    def _completed_scan_etag(self, task_id):
+        """
+        Get the ETag of the results of a completed scan.
+        
+        Results of a completed task never change, so the ETag is derived
+        from the task ID instead of hashing the body.
+        
+        Args:
+            task_id: ID of the scanning task
+            
+        Returns:
+            Weak ETag value of the completed scan results
+        """
+        return f'{task_id}-completed'
+
+    def _make_not_modified_scan_response(self, task_id):
+        """
+        Build the 304 Not Modified response of a completed scan.
+        
+        Args:
+            task_id: ID of the scanning task
+            
+        Returns:
+            Response without a body
+        """
+        response = Response(status=304, headers={'Cache-Control': 'private, max-age=5'})
+        response.set_etag(self._completed_scan_etag(task_id), weak=True)
+        return response
+
+    def _make_streamed_scan_response(self, task_id, result):
+        """
+        Build the response of a completed scan by serializing its results one by one.
+        
+        The results are already loaded from the backend, but each website's
+        result is serialized and sent separately, so the serialized JSON
+        document is never built as a whole.
+        
+        Args:
+            task_id: ID of the scanning task
+            result: Dictionary with the completed task status and scan results
+            
+        Returns:
+            Streamed response with the scan results as JSON
+        """
+        def generate():
+            yield '{"status": "completed", "result": ['
+            for index, item in enumerate(result['result']):
+                if index:
+                    yield ', '
+                yield _dumps(item)
+            yield ']}'
+
+        headers = {'Cache-Control': 'private, max-age=5'}
+        response = Response(generate(), status=result['http_status'], mimetype='application/json', headers=headers)
+        response.set_etag(self._completed_scan_etag(task_id), weak=True)
+        return response
\ No newline at end of file
@@ -1,6 +1,70 @@
 from license_checker.license_detector import LicenseDetector
-from .api_tasks import summarize_task, question_task, scan_task
+from .api_tasks import celery_app, summarize_task, question_task, scan_url_task, scan_results_task
+from ..database import Database
+from celery import chord, group, uuid
+from collections import OrderedDict
 from flask import jsonify, make_response
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import hashlib
+import threading
+import time
+
+# Fields required in the JSON payload of each request type
+_REQUIRED_SCAN = frozenset({'urls'})
+_REQUIRED_SUMMARY = frozenset({'website', 'content', 'api', 'api_key'})
+_REQUIRED_QUESTION = frozenset({'summary', 'api', 'api_key'})
+
+# Seconds task statuses are reused between polls, longer once they cannot change
+_POLL_CACHE_TTL = 0.25
+_POLL_CACHE_FINAL_TTL = 30
+_POLL_CACHE_SIZE = 1024
+_FINAL_STATUSES = frozenset({'completed', 'failed', 'cancelled'})
+
+# Task states of scans that are not reused by requests for the same URLs
+_FAILED_STATES = frozenset({'FAILURE', 'REVOKED'})
+
+# Ports omitted from normalized URLs
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+@lru_cache(maxsize=4096)
+def _normalize_url(url):
+    """
+    Normalize a URL so that equivalent URLs are scanned only once.
+    
+    Lowercases the scheme and host, drops default ports and fragments,
+    uses '/' for an empty path and sorts query parameters. URLs without
+    a scheme or host are returned unchanged so they are reported as invalid.
+    
+    Args:
+        url (str): URL to normalize
+        
+    Returns:
+        str: Normalized URL
+    """
+    if not isinstance(url, str):
+        return url
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or '').rstrip('.')
+        port = parts.port
+    except ValueError:
+        return url
+    if not scheme or not host:
+        return url
+
+    netloc = f'[{host}]' if ':' in host else host
+    if parts.username is not None:
+        userinfo = parts.username
+        if parts.password is not None:
+            userinfo += f':{parts.password}'
+        netloc = f'{userinfo}@{netloc}'
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        netloc += f':{port}'
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, parts.path or '/', query, ''))
 
 class APIServices:
     """    
@@ -9,9 +73,13 @@ class APIServices:
     """
     def __init__(self):
         """
-        Initialize the API services with a LicenseDetector instance.
+        Initialize the API services with a LicenseDetector and Database instance.
         """
-        self.detector = LicenseDetector()
+        self.db = Database()
+        self.detector = LicenseDetector(result_cache=self.db)
+        # LRU cache of task statuses without result bodies, shared by the request threads
+        self._poll_cache = OrderedDict()
+        self._poll_cache_lock = threading.Lock()
 
     def validate_scan_request(self, data):
         """
@@ -23,8 +91,28 @@ class APIServices:
         Returns:
             Response or None: Error response if validation fails, None otherwise
         """
-        if not data or 'urls' not in data:
+        if self._missing_fields(data, _REQUIRED_SCAN):
             return make_response(jsonify({'error': 'Missing urls key in request.'}), 400)
+        return self._validate_urls(data['urls'])
+
+    def validate_scan_batch_request(self, data):
+        """
+        Validate batched scan request data.
+        
+        Args:
+            data (dict): Request data containing a list of batches of URLs to scan
+            
+        Returns:
+            Response or None: Error response if validation fails, None otherwise
+        """
+        if not data or not isinstance(data.get('batches'), list) or not data['batches']:
+            return make_response(jsonify({'error': 'Missing batches key in request.'}), 400)
+        for batch in data['batches']:
+            if not isinstance(batch, dict) or 'urls' not in batch:
+                return make_response(jsonify({'error': 'Missing urls key in batch.'}), 400)
+            validation_error = self._validate_urls(batch['urls'])
+            if validation_error:
+                return validation_error
         return None
 
     def validate_summary_request(self, data):
@@ -37,22 +125,30 @@ class APIServices:
         Returns:
             Response or None: Error response if validation fails, None otherwise
         """
-        if not data or 'website' not in data or 'content' not in data or 'api' not in data or 'api_key' not in data:
-            return make_response(jsonify({'error': 'Missing required fields: "website", "content", "api", or "api_key"'}), 400)
-        return None
+        return self._validate_required_fields(data, _REQUIRED_SUMMARY)
 
     def validate_question_request(self, data):
         """
         Validate question request data.
         
+        Either a single 'question' or a list of 'questions' answered together
+        with one request to the model can be asked.
+        
         Args:
-            data (dict): Request data containing summary, question, API model, and API key
+            data (dict): Request data containing summary, question or questions, API model, and API key
             
         Returns:
             Response or None: Error response if validation fails, None otherwise
         """
-        if not data or 'summary' not in data or 'question' not in data or 'api' not in data or 'api_key' not in data:
-            return make_response(jsonify({'error': 'Missing required fields: "summary", "question", "api", or "api_key"'}), 400)
+        validation_error = self._validate_required_fields(data, _REQUIRED_QUESTION)
+        if validation_error:
+            return validation_error
+        if 'questions' in data:
+            questions = data['questions']
+            if not isinstance(questions, list) or not questions or not all(isinstance(q, str) for q in questions):
+                return make_response(jsonify({'error': 'Questions must be a non-empty list of strings.'}), 400)
+        elif 'question' not in data:
+            return make_response(jsonify({'error': 'Missing required fields: "question"'}), 400)
         return None
 
     def scan_websites(self, urls):
@@ -65,7 +161,7 @@ class APIServices:
         Returns:
             dict: Dictionary containing scan results with detected licenses
         """
-        return self.detector.scan_websites(urls)
+        return self.detector.scan_websites(self._normalize_urls(urls))
 
     def queue_summary_task(self, data):
         """
@@ -99,9 +195,105 @@ class APIServices:
             data (dict): Data containing URLs to scan
             
         Returns:
-            AsyncResult: Celery task object representing the queued task
+            AsyncResult: Celery task object representing the chord callback
+        """
+        return self.queue_scan_tasks([data])[0]
+
+    def queue_scan_tasks(self, batches):
+        """
+        Queue a website scanning task with Celery for each batch of URLs.
+        
+        Each URL is scanned by its own task and the results of a batch are
+        collected by a chord callback. The header group is saved under the
+        callback's ID so the scan can be recognized while the chord is running.
+        URLs are normalized and deduplicated first, and requests for the
+        same set of URLs are coalesced into the scan already in flight
+        unless that scan failed. The chords of all batches are published
+        together, and their reservations and header groups are each stored
+        in a single round-trip.
+        
+        Args:
+            batches (list): List of dictionaries containing URLs to scan
+            
+        Returns:
+            list: Celery task objects representing the chord callbacks, in the order of batches
+        """
+        url_sets = [self._normalize_urls(batch['urls']) for batch in batches]
+        scan_hashes = [self._hash_urls(urls) for urls in url_sets]
+        task_ids = [uuid() for _ in batches]
+        existing_ids = self.db.reserve_scans(scan_hashes, task_ids)
+
+        tasks = [
+            self._reuse_scan(scan_hash, task_id, existing_id)
+            for scan_hash, task_id, existing_id in zip(scan_hashes, task_ids, existing_ids)
+        ]
+        queued = [index for index, task in enumerate(tasks) if task is None]
+        if not queued:
+            return tasks
+
+        signatures = [
+            chord(
+                [scan_url_task.s(url) for url in url_sets[index]],
+                scan_results_task.s().set(task_id=task_ids[index])
+            )
+            for index in queued
+        ]
+        try:
+            results = group(signatures).apply_async().results
+            self._save_groups(results)
+        except Exception:
+            # The tasks were not queued, so later requests must not be coalesced into them
+            self.db.release_scans([scan_hashes[index] for index in queued], [task_ids[index] for index in queued])
+            raise
+
+        for index, task in zip(queued, results):
+            tasks[index] = task
+        return tasks
+
+    def _reuse_scan(self, scan_hash, task_id, existing_id):
+        """
+        Get the scan a request is coalesced into, releasing the reservation of a failed scan.
+        
+        Args:
+            scan_hash (str): Hash identifying the set of scanned URLs
+            task_id (str): ID of the task that would perform the scan
+            existing_id (str): ID of the task holding the reservation, or None
+                               if the scan was reserved for task_id
+            
+        Returns:
+            AsyncResult or None: The scan already in flight or completed,
+                                 or None if the scan is reserved for task_id
+        """
+        if not existing_id:
+            return None
+
+        existing = scan_results_task.AsyncResult(existing_id)
+        if existing.state not in _FAILED_STATES:
+            return existing
+
+        self.db.release_scan(scan_hash, existing_id)
+        existing_id = self.db.reserve_scan(scan_hash, task_id)
+        return scan_results_task.AsyncResult(existing_id) if existing_id else None
+
+    def _save_groups(self, tasks):
         """
-        return scan_task.delay(data)
+        Save the header groups of queued chords under their callbacks' IDs in one round-trip.
+        
+        Stores the same records as the result backend's save_group.
+        
+        Args:
+            tasks (list): AsyncResults of the chord callbacks, with the header groups as parents
+        """
+        backend = celery_app.backend
+        with backend.client.pipeline(transaction=False) as pipe:
+            for task in tasks:
+                key = backend.get_key_for_group(task.id)
+                value = backend.encode({'result': task.parent.as_tuple()})
+                if backend.expires:
+                    pipe.setex(key, backend.expires, value)
+                else:
+                    pipe.set(key, value)
+            pipe.execute()
 
     def get_summary_task_result(self, task_id):
         """
@@ -113,8 +305,10 @@ class APIServices:
         Returns:
             dict: Task status and result information
         """
-        task = summarize_task.AsyncResult(task_id)
-        return self._get_task_result(task)
+        return self._get_polled_result(
+            ('summarize_task', task_id),
+            lambda: self._get_task_result(summarize_task.AsyncResult(task_id))
+        )
 
     def get_question_task_result(self, task_id):
         """
@@ -126,8 +320,10 @@ class APIServices:
         Returns:
             dict: Task status and result information
         """
-        task = question_task.AsyncResult(task_id)
-        return self._get_task_result(task)
+        return self._get_polled_result(
+            ('question_task', task_id),
+            lambda: self._get_task_result(question_task.AsyncResult(task_id))
+        )
 
     def get_scan_task_result(self, task_id):
         """
@@ -139,22 +335,132 @@ class APIServices:
         Returns:
             dict: Task status and result information
         """
-        task = scan_task.AsyncResult(task_id)
-        return self._get_task_result(task)
+        return self._get_polled_result(('scan_results_task', task_id), lambda: self._get_task_result(
+            scan_results_task.AsyncResult(task_id),
+            celery_app.GroupResult.restore(task_id)
+        ))
+
+    def _get_polled_result(self, cache_key, fetch_result):
+        """
+        Get a task result, reusing its status for polls arriving shortly after each other.
+        
+        Only statuses without a result body are cached, so completed results
+        are always fetched from the backend instead of being kept in memory.
+        
+        Args:
+            cache_key (tuple): Key identifying the task
+            fetch_result (callable): Function fetching the task result from the backend
+            
+        Returns:
+            dict: Task status and result information
+        """
+        now = time.monotonic()
+        with self._poll_cache_lock:
+            cached = self._poll_cache.get(cache_key)
+            if cached and cached[0] > now:
+                self._poll_cache.move_to_end(cache_key)
+                return dict(cached[1])
+
+        result = fetch_result()
+        if 'result' in result:
+            return result
+
+        ttl = _POLL_CACHE_FINAL_TTL if result['status'] in _FINAL_STATUSES else _POLL_CACHE_TTL
+        with self._poll_cache_lock:
+            self._poll_cache[cache_key] = (now + ttl, dict(result))
+            self._poll_cache.move_to_end(cache_key)
+            if len(self._poll_cache) > _POLL_CACHE_SIZE:
+                self._poll_cache.popitem(last=False)
+        return result
+
+    def _normalize_urls(self, urls):
+        """
+        Normalize URLs and remove duplicates while keeping their order.
+        
+        Args:
+            urls (list): List of website URLs
+            
+        Returns:
+            list: Unique normalized URLs
+        """
+        return list(dict.fromkeys(_normalize_url(url) for url in urls))
+
+    def _hash_urls(self, urls):
+        """
+        Compute a hash identifying a set of URLs regardless of their order.
+        
+        Args:
+            urls (list): List of website URLs
+            
+        Returns:
+            str: Hex digest of the sorted URLs
+        """
+        joined = "\n".join(sorted(str(url) for url in urls))
+        return hashlib.blake2b(joined.encode(), digest_size=16).hexdigest()
+
+    def _validate_urls(self, urls):
+        """
+        Validate that URLs are given as a list of strings before they are normalized.
+        
+        Args:
+            urls: The urls value of the request data
+            
+        Returns:
+            Response or None: Error response if validation fails, None otherwise
+        """
+        if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+            return make_response(jsonify({'error': 'URLs must be a list of strings.'}), 400)
+        return None
+
+    def _missing_fields(self, data, required):
+        """
+        Get the required fields missing from request data.
+        
+        Args:
+            data (dict): Request data
+            required (frozenset): Names of the required fields
+            
+        Returns:
+            set: Names of the missing fields
+        """
+        if not isinstance(data, dict):
+            return set(required)
+        return required - data.keys()
+
+    def _validate_required_fields(self, data, required):
+        """
+        Validate that request data contains all required fields.
+        
+        Args:
+            data (dict): Request data
+            required (frozenset): Names of the required fields
+            
+        Returns:
+            Response or None: Error response listing the missing fields, None otherwise
+        """
+        missing = self._missing_fields(data, required)
+        if missing:
+            fields = ", ".join(f'"{field}"' for field in sorted(missing))
+            return make_response(jsonify({'error': f'Missing required fields: {fields}'}), 400)
+        return None
 
-    def _get_task_result(self, task):
+    def _get_task_result(self, task, header=None):
         """
         Helper method to process task result and determine status.
         
         Args:
             task (AsyncResult): Celery AsyncResult object
+            header (GroupResult, optional): Header group of a chord whose
+                callback is the task, used to recognize a running chord
             
         Returns:
             dict: Dictionary containing task status, result or error message,
                  and appropriate HTTP status code
         """
         if task.state == 'PENDING':
-            if not task.backend.get(task.id):
+            if header is not None:
+                return {'status': 'processing', 'total': len(header), 'http_status': 202}
+            if not task.backend.client.exists(task.backend.get_key_for_task(task.id)):
                 return {'status': 'not_found', 'error': 'Task not found', 'http_status': 404}
             return {'status': 'processing', 'http_status': 202}
         elif task.state == 'SUCCESS':
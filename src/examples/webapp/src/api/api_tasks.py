@@ -1,13 +1,35 @@
 from celery import Celery
+from celery.signals import task_postrun
+from celery_batches import Batches
+from collections import OrderedDict
 from license_checker import ModelManager, LicenseDetector
+from ..database import Database
+import hashlib
+import threading
 import os
 
-# Dictionary to cache models
-_model_cache = {}
+# LRU cache of models keyed by (API name, API key hash)
+_model_cache = OrderedDict()
+_model_cache_lock = threading.Lock()
+_MODEL_CACHE_SIZE = 16
+
+# Summary requests are batched until this many are queued or the interval (in seconds) passes
+SUMMARY_BATCH_SIZE = 8
+SUMMARY_BATCH_INTERVAL = 0.05
+
+# Detector shared by all scan tasks running in the worker process, caching results in Redis
+_detector = LicenseDetector(result_cache=Database())
 
 # Configure Celery with Redis as the broker
 redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 celery_app = Celery('tasks', broker=redis_url, backend=redis_url, broker_connection_retry_on_startup=True)
+celery_app.conf.update(
+    task_serializer='msgpack',
+    result_serializer='msgpack',
+    accept_content=['msgpack'],
+    result_compression='zstd',
+    result_expires=1800,  # 30 minutes, same as the webapp Database
+)
 
 def _get_cached_model(selected_api, api_key):
     """
@@ -15,6 +37,9 @@ def _get_cached_model(selected_api, api_key):
     
     This function implements a caching mechanism for language models to avoid
     recreating model instances for each request, improving performance.
+    Models are cached per API key, so concurrent tasks never swap each
+    other's keys, and the least recently used model is evicted once the
+    cache is full.
     
     Args:
         selected_api (str): The API model name (e.g., 'gemini', 'mistral').
@@ -29,54 +54,113 @@ def _get_cached_model(selected_api, api_key):
     if not selected_api:
         raise ValueError("No API selected")
     
-    if selected_api in _model_cache:
-        model = _model_cache[selected_api]
-        model.set_api_key(api_key)
-        return model
+    key_hash = hashlib.sha256((api_key or "").encode()).hexdigest()
+    cache_key = (selected_api, key_hash)
+
+    with _model_cache_lock:
+        if cache_key in _model_cache:
+            _model_cache.move_to_end(cache_key)
+            return _model_cache[cache_key]
         
-    model_manager = ModelManager()
-    model = model_manager.get_model(selected_api, api_key)
-    if not model:
-        raise ValueError(f"Invalid API selected: {selected_api}")
+        model_manager = ModelManager()
+        model = model_manager.get_model(selected_api, api_key)
+        if not model:
+            raise ValueError(f"Invalid API selected: {selected_api}")
         
-    _model_cache[selected_api] = model
+        _model_cache[cache_key] = model
+        if len(_model_cache) > _MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
         
     return model
 
-@celery_app.task(bind=True)
-def summarize_task(self, website_data):
+def _notify_task_done(task_id, state):
     """
-    Celery task for generating a summary of license document content.
+    Publish the final state of a task on its task_done channel.
     
-    This task processes website data asynchronously, retrieving the
-    appropriate language model based on the specified API, and generating
-    a summary of the license document.
+    Clients can subscribe to task_done:<task_id> to be notified when the
+    result is stored instead of polling the status endpoint.
     
     Args:
-        self: Celery task instance (automatically provided by Celery)
-        website_data (dict): Dictionary containing:
-            - website (str): Website URL
-            - content (str): License document content
-            - api (str): API model to use (e.g., 'gemini', 'mistral')
-            - api_key (str): API key for authentication
-    
-    Returns:
-        dict: Summary of the license document
+        task_id (str): ID of the finished task
+        state (str): Final state of the task
+    """
+    celery_app.backend.client.publish(f"task_done:{task_id}", state)
+
+@task_postrun.connect
+def _on_task_postrun(sender=None, task_id=None, state=None, **kwargs):
+    """
+    Notify subscribers when a task with a stored result finishes.
     
-    Raises:
-        ValueError: If the API is invalid or not selected
+    Batched summary tasks notify about each request themselves, and scan
+    tasks of a single URL have no result of their own to fetch.
     """
-    selected_api = website_data.get('api')
-    api_key = website_data.get('api_key')
+    if sender in (question_task, scan_results_task):
+        _notify_task_done(task_id, state)
 
-    # Create a copy of website_data without the API key
-    safe_website_data = {k: v for k, v in website_data.items() if k != 'api_key'}
+@celery_app.task(base=Batches, flush_every=SUMMARY_BATCH_SIZE, flush_interval=SUMMARY_BATCH_INTERVAL)
+def summarize_task(requests):
+    """
+    Celery task for generating summaries of license document content.
     
-    model = _get_cached_model(selected_api, api_key)
+    Summary requests queued within a short window are delivered together.
+    Requests using the same API and API key are summarized with a single
+    call to the language model, and the summary of each request is stored
+    as the result of its own task.
     
-    summary = model.summarize(safe_website_data)
+    Args:
+        requests (list): Batched task requests, each with args containing
+            website_data (dict): Dictionary containing:
+                - website (str): Website URL
+                - content (str): License document content
+                - api (str): API model to use (e.g., 'gemini', 'mistral')
+                - api_key (str): API key for authentication
+    """
+    batches = {}
+    for request in requests:
+        website_data = request.args[0]
+        batch_key = (website_data.get('api'), website_data.get('api_key'))
+        batches.setdefault(batch_key, []).append(request)
+
+    for (selected_api, api_key), batch in batches.items():
+        # Create copies of website_data without the API key
+        safe_website_data = [
+            {k: v for k, v in request.args[0].items() if k != 'api_key'}
+            for request in batch
+        ]
+        
+        try:
+            model = _get_cached_model(selected_api, api_key)
+            summaries = model.summarize_many(safe_website_data)
+        except Exception:
+            # Summarize separately so one invalid request does not fail the others
+            for request, data in zip(batch, safe_website_data):
+                _summarize_request(request, selected_api, api_key, data)
+            continue
+
+        for request, summary in zip(batch, summaries):
+            celery_app.backend.mark_as_done(request.id, summary, request=request)
+            _notify_task_done(request.id, 'SUCCESS')
+
+def _summarize_request(request, selected_api, api_key, website_data):
+    """
+    Summarize the data of a single batched request and store its result.
     
-    return summary
+    Args:
+        request: The batched task request
+        selected_api (str): The API model name
+        api_key (str): API key for the selected API
+        website_data (dict): Website data without the API key
+    """
+    try:
+        model = _get_cached_model(selected_api, api_key)
+        summary = model.summarize(website_data)
+    except Exception as e:
+        celery_app.backend.mark_as_failure(request.id, e, request=request)
+        _notify_task_done(request.id, 'FAILURE')
+        return
+
+    celery_app.backend.mark_as_done(request.id, summary, request=request)
+    _notify_task_done(request.id, 'SUCCESS')
 
 @celery_app.task(bind=True)
 def question_task(self, question_data):
@@ -85,18 +169,20 @@ def question_task(self, question_data):
     
     This task processes question data asynchronously, retrieving the
     appropriate language model based on the specified API, and generating
-    an answer to the question about the license document.
+    answers to the questions about the license document. Several questions
+    are answered with a single call to the language model.
     
     Args:
         self: Celery task instance (automatically provided by Celery)
         question_data (dict): Dictionary containing:
             - summary (dict): Summary of the license document
-            - question (str): Question about the license document
+            - question (str): Question about the license document, or
+            - questions (list): Questions about the license document
             - api (str): API model to use (e.g., 'gemini', 'mistral')
             - api_key (str): API key for authentication
     
     Returns:
-        str: Answer to the question about the license document
+        str or list: Answer to the question, or answers to the questions in the same order
     
     Raises:
         ValueError: If the API is invalid or not selected
@@ -106,28 +192,39 @@ def question_task(self, question_data):
     
     model = _get_cached_model(selected_api, api_key)
     
-    question = question_data['question']
-    answer = model.answer_question(question_data, question)
+    if 'questions' in question_data:
+        return model.answer_questions(question_data, question_data['questions'])
 
-    return answer
+    return model.answer_questions(question_data, [question_data['question']])[0]
 
-@celery_app.task(bind=True)
-def scan_task(self, scan_data):
+@celery_app.task(bind=True, ignore_result=True)
+def scan_url_task(self, url):
     """
-    Celery task for scanning websites for licenses.
+    Celery task for scanning a single website for licenses.
     
-    This task processes website URLs asynchronously, scanning each URL
-    for license information using the LicenseDetector.
+    Scans are queued as a chord of these tasks, one per URL, so independent
+    HTTP fetches run in parallel across the worker pool. The result is only
+    passed on to the chord callback and is not stored on its own.
     
     Args:
         self: Celery task instance (automatically provided by Celery)
-        scan_data (dict): Dictionary containing:
-            - urls (list): List of website URLs to scan
+        url (str): Website URL to scan
     
     Returns:
-        dict: Dictionary containing scan results with detected licenses
-    """    
-    detector = LicenseDetector()
-    results = detector.scan_websites(scan_data['urls'])
+        dict: Scan result with detected licenses for the website
+    """
+    return _detector.scan_websites([url])[0]
+
+@celery_app.task(bind=True)
+def scan_results_task(self, results):
+    """
+    Celery chord callback aggregating the results of scan_url_task.
     
-    return results
\ No newline at end of file
+    Args:
+        self: Celery task instance (automatically provided by Celery)
+        results (list): Per-URL scan results in the order the URLs were queued
+    
+    Returns:
+        list: Scan results with detected licenses for each website
+    """
+    return list(results)
@@ -1,10 +1,55 @@
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from flask_session import Session
+from jinja2 import FileSystemBytecodeCache
 import os
+import redis
+import tempfile
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider serializing with orjson, used by jsonify and request.get_json.
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 class FlaskApp:
     def __init__(self):
         self.app = Flask(__name__)
-        self.app.secret_key = os.urandom(24)
+        if orjson is not None:
+            self.app.json = ORJSONProvider(self.app)
+        self._configure_templates()
+        self._configure_sessions()
+        self.app.secret_key = os.getenv('FLASK_SECRET_KEY')
+        if not self.app.secret_key:
+            # Sessions are only valid within this process, set FLASK_SECRET_KEY to share them between workers
+            self.app.logger.warning('FLASK_SECRET_KEY is not set, using a random secret key')
+            self.app.secret_key = os.urandom(24)
     
+    def _configure_templates(self):
+        # Compiled templates are shared between workers and survive restarts
+        cache_dir = os.getenv('JINJA_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'jinja_cache'))
+        os.makedirs(cache_dir, exist_ok=True)
+        self.app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+        self.app.jinja_env.auto_reload = os.getenv('FLASK_DEBUG') == '1'
+
+    def _configure_sessions(self):
+        # Sessions hold API keys, keep them in Redis shared by all workers instead of the cookie
+        redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+        self.app.config.update(
+            SESSION_TYPE='redis',
+            SESSION_REDIS=redis.Redis.from_url(redis_url),
+            SESSION_KEY_PREFIX='session:',
+        )
+        Session(self.app)
+
     def get_app(self):
         return self.app
\ No newline at end of file
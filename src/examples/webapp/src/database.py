@@ -1,6 +1,46 @@
 import json
 import os
 import redis
+import zstandard as zstd
+
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    _dumps, _loads = json.dumps, json.loads
+
+# Payloads larger than this many bytes are stored compressed
+COMPRESSION_THRESHOLD = 1024
+
+# Prefixes marking stored payloads as raw or compressed
+RAW_PREFIX = b'\x00'
+COMPRESSED_PREFIX = b'\x01'
+
+_compressor = zstd.ZstdCompressor(level=3)
+_decompressor = zstd.ZstdDecompressor()
+
+# Increments the counter and stores the value under the new ID atomically
+STORE_SCRIPT = """
+local id = redis.call('INCR', KEYS[1])
+redis.call('SETEX', KEYS[2] .. id, ARGV[1], ARGV[2])
+return id
+"""
+
+# Sets the key unless it exists and returns the value it holds afterwards
+RESERVE_SCRIPT = """
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    return ARGV[1]
+end
+return redis.call('GET', KEYS[1])
+"""
+
+# Deletes the key only while it still holds the expected value
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
 
 class Database:
     """
@@ -11,15 +51,24 @@ class Database:
         redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
         self.redis_client = redis.Redis.from_url(redis_url)
         self.result_expiry = 1800  # 30 minutes
+        self.summary_expiry = 86400  # 24 hours, summaries are expensive to regenerate
+        self.license_result_expiry = 21600  # 6 hours, licensing rarely changes
+        self._store_script = self.redis_client.register_script(STORE_SCRIPT)
+        self._reserve_script = self.redis_client.register_script(RESERVE_SCRIPT)
+        self._release_script = self.redis_client.register_script(RELEASE_SCRIPT)
 
-    def set_expiry_time(self, seconds):
+    def set_expiry_time(self, seconds, summary_seconds=None):
         """
         Set the expiry time for stored data.
         
         Args:
-            seconds (int): The number of seconds until data expires.
+            seconds (int): The number of seconds until scan results expire.
+            summary_seconds (int): The number of seconds until summaries and
+                                   answers expire (default: unchanged).
         """
         self.result_expiry = seconds
+        if summary_seconds is not None:
+            self.summary_expiry = summary_seconds
 
     def store_scan_results(self, results):
         """
@@ -31,14 +80,19 @@ class Database:
         Returns:
             str: A unique identifier for the stored data.
         """
-        key = self.redis_client.incr("scan_results_counter")
-        result_id = str(key)
-        self.redis_client.setex(
-            f"scan_results:{result_id}", 
-            self.result_expiry, 
-            json.dumps(results)
-        )
-        return result_id
+        return self._store("scan_results_counter", "scan_results:", results, self.result_expiry)
+        
+    def update_scan_results(self, result_id, results):
+        """
+        Replace the scan results stored under an existing identifier.
+        
+        Args:
+            result_id (str): The unique identifier for the stored results.
+            results (list): The scan results to store.
+        """
+        self._validate_id(result_id)
+        
+        self.redis_client.setex(f"scan_results:{result_id}", self.result_expiry, self._serialize(results))
         
     def get_scan_results(self, result_id):
         """
@@ -60,8 +114,8 @@ class Database:
             raise ValueError("Scan results not found or expired")
             
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return self._deserialize(data)
+        except (json.JSONDecodeError, zstd.ZstdError):
             raise ValueError("Invalid data format stored in cache")
 
     def store_summary_data(self, summary_data):
@@ -74,14 +128,7 @@ class Database:
         Returns:
             str: A unique identifier for the stored data.
         """
-        key = self.redis_client.incr("summary_data_counter")
-        result_id = str(key)
-        self.redis_client.setex(
-            f"summary_data:{result_id}", 
-            self.result_expiry, 
-            json.dumps(summary_data)
-        )
-        return result_id
+        return self._store("summary_data_counter", "summary_data:", summary_data, self.summary_expiry)
     
     def get_summary_data(self, result_id):
         """
@@ -103,8 +150,8 @@ class Database:
             raise ValueError("Summary data not found or expired")
             
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return self._deserialize(data)
+        except (json.JSONDecodeError, zstd.ZstdError):
             raise ValueError("Invalid data format stored in cache")
             
     def store_answer(self, result_id, question, answer):
@@ -119,20 +166,13 @@ class Database:
         Returns:
             str: A unique identifier for the stored answer.
         """
-        key = self.redis_client.incr("answer_counter")
-        answer_id = str(key)
         answer_data = {
             'result_id': result_id,
             'question': question,
             'answer': answer,
         }
             
-        self.redis_client.setex(
-            f"answer:{answer_id}", 
-            self.result_expiry, 
-            json.dumps(answer_data)
-        )
-        return answer_id
+        return self._store("answer_counter", "answer:", answer_data, self.summary_expiry)
         
     def get_answer(self, answer_id):
         """
@@ -154,10 +194,164 @@ class Database:
             raise ValueError("Answer not found or expired")
             
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return self._deserialize(data)
+        except (json.JSONDecodeError, zstd.ZstdError):
             raise ValueError("Invalid answer data format stored in cache")
 
+    def store_license_result(self, url, result):
+        """
+        Cache the license detection result of a website in Redis.
+        
+        Args:
+            url (str): The scanned website URL.
+            result (dict): The license detection result of the website.
+        """
+        self.redis_client.setex(f"license_result:{url}", self.license_result_expiry, self._serialize(result))
+
+    def get_license_result(self, url):
+        """
+        Retrieve the cached license detection result of a website from Redis.
+        
+        Args:
+            url (str): The scanned website URL.
+            
+        Returns:
+            dict or None: The cached license detection result, or None if not cached.
+        """
+        data = self.redis_client.get(f"license_result:{url}")
+        if not data:
+            return None
+            
+        try:
+            return self._deserialize(data)
+        except (json.JSONDecodeError, zstd.ZstdError):
+            return None
+
+    def reserve_scan(self, scan_hash, task_id):
+        """
+        Reserve a scan of a set of URLs for a task unless one is in flight.
+        
+        Args:
+            scan_hash (str): The hash identifying the set of scanned URLs.
+            task_id (str): The ID of the task that would perform the scan.
+            
+        Returns:
+            str or None: The ID of the task already scanning the URLs,
+                         or None if the scan was reserved for task_id.
+        """
+        # Set or get in one script, so the key cannot expire between the two
+        existing_id = self._reserve_script(
+            keys=[f"scan_inflight:{scan_hash}"],
+            args=[task_id, self.result_expiry]
+        ).decode()
+        return None if existing_id == task_id else existing_id
+
+    def reserve_scans(self, scan_hashes, task_ids):
+        """
+        Reserve scans of several sets of URLs in a single round-trip.
+        
+        Args:
+            scan_hashes (list): The hashes identifying the sets of scanned URLs.
+            task_ids (list): The IDs of the tasks that would perform the scans.
+            
+        Returns:
+            list: For each scan, the ID of the task already scanning the URLs,
+                  or None if the scan was reserved for its task ID.
+        """
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            for scan_hash, task_id in zip(scan_hashes, task_ids):
+                self._reserve_script(
+                    keys=[f"scan_inflight:{scan_hash}"],
+                    args=[task_id, self.result_expiry],
+                    client=pipe
+                )
+            existing_ids = [existing_id.decode() for existing_id in pipe.execute()]
+        return [
+            None if existing_id == task_id else existing_id
+            for existing_id, task_id in zip(existing_ids, task_ids)
+        ]
+
+    def release_scans(self, scan_hashes, task_ids):
+        """
+        Release the reservations of several scans in a single round-trip.
+        
+        Args:
+            scan_hashes (list): The hashes identifying the sets of scanned URLs.
+            task_ids (list): The IDs of the tasks holding the reservations.
+        """
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            for scan_hash, task_id in zip(scan_hashes, task_ids):
+                self._release_script(keys=[f"scan_inflight:{scan_hash}"], args=[task_id], client=pipe)
+            pipe.execute()
+
+    def release_scan(self, scan_hash, task_id):
+        """
+        Release the reservation of a scan held by a task.
+        
+        The reservation is kept if it has meanwhile been taken over by
+        another task.
+        
+        Args:
+            scan_hash (str): The hash identifying the set of scanned URLs.
+            task_id (str): The ID of the task holding the reservation.
+        """
+        self._release_script(keys=[f"scan_inflight:{scan_hash}"], args=[task_id])
+
+    def _store(self, counter_key, key_prefix, data, expiry):
+        """
+        Store data under a new unique identifier in a single round-trip.
+        
+        Args:
+            counter_key (str): The Redis key of the identifier counter.
+            key_prefix (str): The prefix of the key the data is stored under.
+            data: The data to store.
+            expiry (int): The number of seconds until the data expires.
+            
+        Returns:
+            str: The unique identifier for the stored data.
+        """
+        key = self._store_script(
+            keys=[counter_key, key_prefix],
+            args=[expiry, self._serialize(data)]
+        )
+        return str(key)
+
+    def _serialize(self, data):
+        """
+        Serialize data for storage, compressing large payloads.
+        
+        Args:
+            data: The data to serialize.
+            
+        Returns:
+            bytes: The prefixed, possibly compressed, serialized data.
+        """
+        raw = _dumps(data)
+        if isinstance(raw, str):
+            raw = raw.encode()
+        if len(raw) > COMPRESSION_THRESHOLD:
+            return COMPRESSED_PREFIX + _compressor.compress(raw)
+        return RAW_PREFIX + raw
+
+    def _deserialize(self, data):
+        """
+        Deserialize stored data, decompressing it if needed.
+        
+        Data stored without a prefix is read as plain JSON.
+        
+        Args:
+            data (bytes): The stored data.
+            
+        Returns:
+            The deserialized data.
+        """
+        prefix = data[:1]
+        if prefix == COMPRESSED_PREFIX:
+            return _loads(_decompressor.decompress(data[1:]))
+        if prefix == RAW_PREFIX:
+            return _loads(data[1:])
+        return _loads(data)
+
     def _validate_id(self, id_value):
         """
         Validate that an ID value is provided.
@@ -1,4 +1,6 @@
-from flask import render_template, request, session, redirect, url_for
+from collections import OrderedDict
+from flask import render_template, stream_template, request, session, redirect, url_for
+import threading
 
 class Router:
     """    
@@ -20,6 +22,11 @@ class Router:
         """
         self.app = app
         self.services = services
+        self.error_template = self.app.jinja_env.get_template('error.html')
+        # LRU cache of rendered error pages keyed by (message, code)
+        self.error_pages = OrderedDict()
+        self.error_pages_size = 256
+        self.error_pages_lock = threading.Lock()
         self.register_routes()
 
     def register_routes(self):
@@ -51,10 +58,11 @@ class Router:
             Route handler for processing URL submissions.
             
             Processes the URLs submitted by the user, stores API keys in the session,
-            scans the submitted websites, then redirects to the scans view.
+            then scans the submitted websites while streaming each website's result
+            to the browser as soon as it is ready.
             
             Returns:
-                Response: Redirects to the scans view page or renders an error message.
+                Response: Streamed scans page or a rendered error message.
                 
             Raises:
                 ValueError: If URL processing or website scanning fails.
@@ -64,11 +72,12 @@ class Router:
             urls = [url.strip() for url in request.form['urls'].split('\n') if url.strip()]
             
             try:
-                result_id = self.services.scan_websites(urls)
-                
-                return redirect(url_for('view_scan', scan_id=result_id))
+                result_id, results = self.services.scan_websites_stream(urls)
             except ValueError as e:
-                return render_template('error.html', title="Error", message=str(e), code=400)
+                return self._render_error(str(e), 400)
+                
+            return stream_template('scans.html', title="Scan Results", results=results,
+                                   scan_id=result_id, streaming=True)
 
         @self.app.route('/scans/<scan_id>', methods=['GET'])
         def view_scan(scan_id):
@@ -87,15 +96,15 @@ class Router:
                 results = self.services.retrieve_scan_results(scan_id)
                 return render_template('scans.html', title="Scan Results", results=results, scan_id=scan_id)
             except ValueError as e:
-                return render_template('error.html', title="Error", message=str(e), code=404)
+                return self._render_error(str(e), 404)
 
         @self.app.route('/scans/<scan_id>/summaries', methods=['POST'])
         def create_summary(scan_id):
             """
             Route handler for processing summary requests.
             
-            Retrieves the selected API and its key from the session, processes the raw scan results,
-            then redirects to the summary view route.
+            Retrieves the selected API and its key from the session, summarizes the selected
+            website's stored scan result, then redirects to the summary view route.
             
             Args:
                 scan_id (str): Unique identifier for the stored scan results
@@ -108,20 +117,18 @@ class Router:
             """
             selected_api = request.form['api']
             api_key = session.get(selected_api)
-            raw_result = request.form.get('result')
+            result_index = request.form.get('result_index')
             
             try:
                 if not api_key:
-                    return render_template('error.html', title="Error", 
-                                        message=f"No API key provided for {selected_api}.", 
-                                        code=400)
+                    return self._render_error(f"No API key provided for {selected_api}.", 400)
                 
-                summary_id = self.services.summarize_results(raw_result, selected_api, api_key)
+                summary_id = self.services.summarize_results(scan_id, result_index, selected_api, api_key)
                 
                 return redirect(url_for('view_summary', scan_id=scan_id, summary_id=summary_id, api=selected_api))
             except ValueError as e:
                 code = 401 if "API" in str(e) else 400
-                return render_template('error.html', title="Error", message=str(e), code=code)
+                return self._render_error(str(e), code)
 
         @self.app.route('/scans/<scan_id>/summaries/<summary_id>', methods=['GET'])
         def view_summary(scan_id, summary_id):
@@ -148,7 +155,7 @@ class Router:
                                      scan_id=scan_id,
                                      summary_id=summary_id)
             except ValueError as e:
-                return render_template('error.html', title="Error", message=str(e), code=404)
+                return self._render_error(str(e), 404)
 
         @self.app.route('/scans/<scan_id>/summaries/<summary_id>/answers', methods=['POST'])
         def create_answer(scan_id, summary_id):
@@ -178,7 +185,7 @@ class Router:
                 return redirect(url_for('view_answer', scan_id=scan_id, summary_id=summary_id, answer_id=answer_id, api=selected_api))
             except ValueError as e:
                 code = 401 if "API" in str(e) else 400
-                return render_template('error.html', title="Error", message=str(e), code=code)
+                return self._render_error(str(e), code)
                 
         @self.app.route('/scans/<scan_id>/summaries/<summary_id>/answers/<answer_id>', methods=['GET'])
         def view_answer(scan_id, summary_id, answer_id):
@@ -209,7 +216,7 @@ class Router:
                                      scan_id=scan_id,
                                      summary_id=summary_id)
             except ValueError as e:
-                return render_template('error.html', title="Error", message=str(e), code=404)
+                return self._render_error(str(e), 404)
     
     def _store_api_keys(self):
         """
@@ -222,4 +229,29 @@ class Router:
         for key in api_keys:
             form_value = request.form.get(f"{key}_api_key", "").strip()
             if form_value:
-                session[key] = form_value
\ No newline at end of file
+                session[key] = form_value
+
+    def _render_error(self, message, code):
+        """
+        Render the error page, reusing a previously rendered page for the same error.
+        
+        Args:
+            message (str): Error message to display.
+            code (int): HTTP status code shown in the page header.
+            
+        Returns:
+            str: Rendered HTML error page.
+        """
+        key = (message, code)
+        with self.error_pages_lock:
+            page = self.error_pages.get(key)
+            if page is not None:
+                self.error_pages.move_to_end(key)
+                return page
+            
+        page = self.error_template.render(title="Error", message=message, code=code)
+        with self.error_pages_lock:
+            self.error_pages[key] = page
+            if len(self.error_pages) > self.error_pages_size:
+                self.error_pages.popitem(last=False)
+        return page
\ No newline at end of file
@@ -1,6 +1,8 @@
 import json
-import ast
+import hashlib
 import os
+import threading
+from collections import OrderedDict
 from license_checker import LicenseDetector, ModelManager
 from .database import Database
 
@@ -11,10 +13,13 @@ class Services:
     It uses a separate Database class for data storage and retrieval.
     """
     def __init__(self):
-        self.detector = LicenseDetector()
         self.model_manager = ModelManager()
         self.db = Database()
-        self.models = {}
+        self.detector = LicenseDetector(result_cache=self.db)
+        # LRU cache of models keyed by (API name, API key hash), shared by the request threads
+        self.models = OrderedDict()
+        self.models_lock = threading.Lock()
+        self.models_cache_size = 16
 
 
     def scan_websites(self, urls):
@@ -34,12 +39,51 @@ class Services:
         results = self.detector.scan_websites(urls)
         return self.db.store_scan_results(results)
 
-    def summarize_results(self, raw_result, selected_api, api_key):
+    def scan_websites_stream(self, urls):
         """
-        Summarize scan results using the selected API.
+        Start scanning websites, storing the results as they become available.
+        
+        The scan results are stored under an identifier reserved up front, so
+        the results scanned so far can be viewed while the scan is running.
+        
+        Args:
+            urls (list): A list of URLs to scan.
+            
+        Returns:
+            tuple: The unique identifier for the stored scan results and a
+                   generator yielding the result of each website as it is scanned.
+            
+        Raises:
+            ValueError: If no valid URLs are provided.
+        """
+        self._validate_urls(urls)
+        result_id = self.db.store_scan_results([])
+        return result_id, self._stream_scan_results(result_id, urls)
+
+    def _stream_scan_results(self, result_id, urls):
+        """
+        Scan websites and store the results gathered so far after each one.
         
         Args:
-            raw_result (str): Raw scan results to summarize.
+            result_id (str): The unique identifier for the stored scan results.
+            urls (list): A list of URLs to scan.
+            
+        Yields:
+            dict: The scan result of each website.
+        """
+        results = []
+        for result in self.detector.scan_websites_iter(urls):
+            results.append(result)
+            self.db.update_scan_results(result_id, results)
+            yield result
+
+    def summarize_results(self, scan_id, result_index, selected_api, api_key):
+        """
+        Summarize the stored scan result of a website using the selected API.
+        
+        Args:
+            scan_id (str): The unique identifier for the stored scan results.
+            result_index (str): Position of the website's result within the scan results.
             selected_api (str): The name of the API model to use (e.g., 'huggingface', 'googleai').
             api_key (str): API key for the selected API.
             
@@ -49,10 +93,7 @@ class Services:
         Raises:
             ValueError: If inputs are invalid or processing fails.
         """
-        if not raw_result:
-            raise ValueError("No scan results provided")
-        
-        result = self._parse_raw_result(raw_result)
+        result = self._get_scan_result(scan_id, result_index)
         
         model = self._get_model(selected_api, api_key)
         summary_data = self._generate_summary(model, result)
@@ -95,14 +136,36 @@ class Services:
         if not question:
             raise ValueError("No question provided")
             
+        return self.answer_questions(result_id, [question], selected_api, api_key)[0]
+
+    def answer_questions(self, result_id, questions, selected_api, api_key):
+        """
+        Answer several questions based on summary data with a single request to the selected API.
+        
+        Args:
+            result_id (str): The unique identifier for the stored summary data.
+            questions (list): The questions to answer.
+            selected_api (str): The name of the API model to use.
+            api_key (str): API key for the selected API.
+            
+        Returns:
+            list: Unique identifiers for the stored answers, in the order of the questions.
+            
+        Raises:
+            ValueError: If inputs are invalid or processing fails.
+        """
+        if not questions or not all(questions):
+            raise ValueError("No question provided")
+            
         summary_data = self.retrieve_summary_data(result_id)
         
         model = self._get_model(selected_api, api_key)
-        answer = self._process_question(summary_data, question, model)
+        answers = self._process_questions(summary_data, questions, model)
         
-        answer_id = self.db.store_answer(result_id, question, answer)
-        
-        return answer_id
+        return [
+            self.db.store_answer(result_id, question, answer)
+            for question, answer in zip(questions, answers)
+        ]
 
     def retrieve_scan_results(self, result_id):
         """
@@ -147,23 +210,29 @@ class Services:
         if not urls or not isinstance(urls, list):
             raise ValueError("No valid URLs provided")
 
-    def _parse_raw_result(self, raw_result):
+    def _get_scan_result(self, scan_id, result_index):
         """
-        Parse raw result string to Python object.
+        Get the result of a single website from stored scan results.
         
         Args:
-            raw_result (str): Raw scan results in string format.
+            scan_id (str): The unique identifier for the stored scan results.
+            result_index (str): Position of the website's result within the scan results.
             
         Returns:
-            dict: Parsed scan results as a Python dictionary.
+            dict: The scan result of the website.
             
         Raises:
-            ValueError: If the raw result format is invalid.
+            ValueError: If the scan results or the website's result are not found.
         """
-        try:
-            return ast.literal_eval(raw_result)
-        except (ValueError, SyntaxError) as e:
-            raise ValueError(f"Invalid scan result format: {str(e)}")
+        if result_index is None or not str(result_index).isdigit():
+            raise ValueError("No scan result selected")
+            
+        results = self.db.get_scan_results(scan_id)
+        index = int(result_index)
+        if index >= len(results):
+            raise ValueError("Scan result not found")
+            
+        return results[index]
 
     def _generate_summary(self, model, result):
         """
@@ -187,23 +256,23 @@ class Services:
             else:
                 raise ValueError(f"Error generating summary: {str(e)}")
 
-    def _process_question(self, summary_data, question, model):
+    def _process_questions(self, summary_data, questions, model):
         """
-        Process question and return answer.
+        Process questions and return their answers.
         
         Args:
             summary_data (dict): The summary data to analyze.
-            question (str): The question to answer.
+            questions (list): The questions to answer.
             model (object): The model instance to use for answering.
             
         Returns:
-            str: The answer to the question.
+            list: The answers to the questions, in the same order.
             
         Raises:
             ValueError: If processing fails or API authentication fails.
         """
         try:
-            return model.answer_question(summary_data, question)
+            return model.answer_questions(summary_data, questions)
         except Exception as e:
             if "API" in str(e):
                 raise ValueError(f"API authentication failed: {str(e)}")
@@ -230,15 +299,20 @@ class Services:
         if not api_key:
             raise ValueError(f"No API key provided for {selected_api}")
         
-        if selected_api in self.models:
-            model = self.models[selected_api]
-            model.set_api_key(api_key)
-            return model
-            
-        model = self.model_manager.get_model(selected_api, api_key)
-        if not model:
-            raise ValueError(f"Invalid API selected: {selected_api}")
-            
-        self.models[selected_api] = model
+        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+        cache_key = (selected_api, key_hash)
+
+        with self.models_lock:
+            if cache_key in self.models:
+                self.models.move_to_end(cache_key)
+                return self.models[cache_key]
+                
+            model = self.model_manager.get_model(selected_api, api_key)
+            if not model:
+                raise ValueError(f"Invalid API selected: {selected_api}")
+                
+            self.models[cache_key] = model
+            if len(self.models) > self.models_cache_size:
+                self.models.popitem(last=False)
             
         return model
\ No newline at end of file
@@ -0,0 +1,5 @@
+# wsgi.py
+from .run import create_app
+
+# WSGI entry point, e.g. gunicorn src.examples.webapp.wsgi:app
+app = create_app()
\ No newline at end of file
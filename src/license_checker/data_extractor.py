@@ -1,9 +1,19 @@
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-from license_checker.parameters import LICENSE_PATTERNS, RELEVANT_LINKS_KEYWORDS, RELEVANT_TEXT_KEYWORDS
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+from license_checker.parameters import (
+    COMBINED_LICENSE_PATTERN, RELEVANT_LINKS_PATTERN, RELEVANT_TEXT_PATTERN, MAX_LINK_WORKERS
+)
+import threading
 import time
 import re
 
+# Number of hosts tracked for the request delay before expired entries are dropped
+HOST_SCHEDULE_SIZE = 1024
+
+# Sentence boundary used to split element text
+SENTENCE_SPLIT_PATTERN = re.compile(r'\.(?=\s|$)')
+
 class DataExtractor:
     """    
     This class processes HTML content to extract license links, relevant URLs,
@@ -20,6 +30,9 @@ class DataExtractor:
         """
         self.request_manager = request_manager
         self.request_delay = request_delay
+        # Earliest time of the next request to each host, shared by all threads
+        self.host_next_request = {}
+        self.host_schedule_lock = threading.Lock()
 
     def parse_html(self, content):
         """
@@ -34,7 +47,7 @@ class DataExtractor:
         if not content:
             return None
             
-        return BeautifulSoup(content, "html.parser")
+        return BeautifulSoup(content, "lxml")
 
     def extract_footer_links(self, soup, base_url):
         """
@@ -52,24 +65,25 @@ class DataExtractor:
             
         license_link = ""
         license_text = ""
-        relevant_links = set()
+        # Insertion ordered, so links keep their order in the page
+        relevant_links = {}
         
         footers = soup.find_all("footer")
         for footer in footers:
-            for link in footer.find_all("a"):
-                href = link.get("href")
+            for link in footer.find_all("a", href=True):
+                href = link["href"]
                 if not href:
                     continue
                 absolute_url = urljoin(base_url, href)
                 text = link.get_text().strip()
 
-                if not license_link and self._contains_pattern(text, LICENSE_PATTERNS):
+                if not license_link and self._contains_pattern(text, COMBINED_LICENSE_PATTERN):
                     license_link = absolute_url
                     license_text = text
                     continue
 
-                if self._contains_keyword(text, RELEVANT_LINKS_KEYWORDS):
-                    relevant_links.add(absolute_url)
+                if self._contains_keyword(text, RELEVANT_LINKS_PATTERN):
+                    relevant_links[absolute_url] = None
             
         return license_link, license_text, list(relevant_links)
 
@@ -86,16 +100,18 @@ class DataExtractor:
         if not soup:
             return ""
             
+        search = RELEVANT_TEXT_PATTERN.search
         elements = soup.find_all(["p", "li", "span"])
         sentences = []
         for element in elements:
             text = element.get_text().strip()
-            text_parts = re.split(r'\.(?=\s|$)', text)
-            
-            for sentence in text_parts:
-                sentence = sentence.strip()
-                if self._contains_keyword(sentence, RELEVANT_TEXT_KEYWORDS):
-                    sentences.append(sentence)
+            # Keywords never span sentences, so elements without any are skipped unsplit
+            if not search(text):
+                continue
+            sentences.extend(
+                sentence for sentence in map(str.strip, SENTENCE_SPLIT_PATTERN.split(text))
+                if search(sentence)
+            )
         
         return ". ".join(sentences)
 
@@ -104,6 +120,10 @@ class DataExtractor:
         """
         Process a list of links to extract license-relevant content.
         
+        Links are grouped by host and the hosts are processed concurrently.
+        Links of one host are fetched one after another, spaced by the
+        request delay, so they reuse the session's keep-alive connection.
+        
         Args:
             links: List of URLs to process
             
@@ -113,60 +133,103 @@ class DataExtractor:
         if not links or not self.request_manager:
             return ""
             
-        combined_content = []
+        links_by_host = {}
         for link in links:
-            content = self.request_manager.fetch_page(link)
-            if content:
-                soup = self.parse_html(content)
-                extracted = self.extract_relevant_text(soup)
-                if extracted:
-                    combined_content.append(extracted)
-            time.sleep(self.request_delay)
+            links_by_host.setdefault(urlparse(link).netloc, []).append(link)
+            
+        extracted = {}
+        max_workers = min(MAX_LINK_WORKERS, len(links_by_host))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            host_texts = executor.map(self._process_host_links, links_by_host.values())
+            for host_links, texts in zip(links_by_host.values(), host_texts):
+                extracted.update(zip(host_links, texts))
+                
+        return " ".join(extracted[link] for link in links if extracted[link])
+
+    def _process_host_links(self, links):
+        """
+        Process the links of a single host one after another.
+        
+        Args:
+            links: List of URLs sharing the same host
+            
+        Returns:
+            List of texts extracted from the links, in the same order
+        """
+        return [self._process_link(link) for link in links]
+
+    def _process_link(self, link):
+        """
+        Fetch a single link and extract its license-relevant text.
+        
+        Args:
+            link: URL to process
+            
+        Returns:
+            Extracted text, or an empty string if the page could not be fetched
+        """
+        self._wait_for_host(urlparse(link).netloc)
+        content = self.request_manager.fetch_page(link)
+
+        if not content:
+            return ""
+        soup = self.parse_html(content)
+        return self.extract_relevant_text(soup)
+
+    def _wait_for_host(self, host):
+        """
+        Wait until a request to the host is allowed by the request delay.
+        
+        Each request reserves the next free time slot of its host, so
+        requests to one host start at least request_delay apart while
+        requests to different hosts never wait for each other.
+        
+        Args:
+            host: Network location of the requested URL
+        """
+        with self.host_schedule_lock:
+            now = time.monotonic()
+            slot = max(now, self.host_next_request.get(host, now))
+            self.host_next_request[host] = slot + self.request_delay
+            if len(self.host_next_request) > HOST_SCHEDULE_SIZE:
+                # Hosts whose next slot has passed impose no wait and can be forgotten
+                self.host_next_request = {
+                    name: next_request for name, next_request in self.host_next_request.items()
+                    if next_request > now
+                }
                 
-        return " ".join(combined_content)
+        wait = slot - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
 
-    def _contains_keyword(self, text, keywords):
+    def _contains_keyword(self, text, keyword_pattern):
         """
         Check if text contains any of the keywords.
         
         Args:
             text: The text to check
-            keywords: List of keywords to look for
+            keyword_pattern: Compiled pattern matching any of the keywords
             
         Returns:
             True if any keyword is found, False otherwise
         """
-        if not text or not keywords:
+        if not text or not keyword_pattern:
             return False
             
-        try:
-            text_lower = text.lower()
-            return any(keyword.lower() in text_lower for keyword in keywords)
-        except Exception:
-            return False
+        return keyword_pattern.search(text) is not None
 
-    def _contains_pattern(self, text, patterns):
+    def _contains_pattern(self, text, pattern):
         """
-        Check if text matches any of the regex patterns.
+        Check if text matches the regex pattern.
         
         Args:
             text: The text to check
-            patterns: Dictionary of pattern_name: compiled_pattern
+            pattern: Compiled case-insensitive pattern, e.g. all license patterns combined
             
         Returns:
-            True if any pattern matches, False otherwise
+            True if the pattern matches, False otherwise
         """
-        if not text or not patterns:
+        if not text or not pattern:
             return False
             
-        try:
-            text_lower = text.lower()
-            for pattern_name, pattern in patterns.items():
-                if pattern.search(text_lower):
-                    match = pattern.search(text_lower)
-                    matched_text = match.group(0)
-                    return True
-        except Exception as e:
-            print(f"Error matching pattern: {e}")
-            
-        return False
\ No newline at end of file
+        return pattern.search(text) is not None
\ No newline at end of file
@@ -1,8 +1,42 @@
 import validators
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from urllib.parse import urlparse
 from license_checker.request_manager import RequestManager
 from license_checker.data_extractor import DataExtractor
 from license_checker.license_identifier import LicenseIdentifier
+from license_checker.parameters import MAX_SCAN_WORKERS
+
+@lru_cache(maxsize=1024)
+def _validate_url(url):
+    """
+    Validate if a URL is properly formatted.
+    
+    Args:
+        url: URL string to validate
+        
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    return bool(validators.url(url)) if url else False
+
+@lru_cache(maxsize=1024)
+def _normalize_url(url):
+    """
+    Extract the base domain from a URL.
+    
+    Args:
+        url: URL to normalize
+        
+    Returns:
+        Base URL as scheme://domain
+    """
+    try:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+    except Exception as e:
+        print(f"Error parsing URL {url}: {e}")
+        return url
 
 class LicenseDetector:
     """
@@ -12,47 +46,21 @@ class LicenseDetector:
     examining relevant pages, and identifying license types.
     """
     
-    def __init__(self, user_agent=None):
+    def __init__(self, user_agent=None, result_cache=None):
         """
-        Initialize the LicenseDetector with optional user agent.
+        Initialize the LicenseDetector with optional user agent and result cache.
         
         Args:
             user_agent: User agent string to use for HTTP requests
+            result_cache: Optional shared cache of results providing
+                          get_license_result(url) and store_license_result(url, result)
         """
         self.request_manager = RequestManager(user_agent)
         self.data_extractor = DataExtractor(self.request_manager)
         self.license_identifier = LicenseIdentifier()
+        self.result_cache = result_cache
         self.all_data = []
 
-    def _validate_url(self, url):
-        """
-        Validate if a URL is properly formatted.
-        
-        Args:
-            url: URL string to validate
-            
-        Returns:
-            bool: True if valid, False otherwise
-        """
-        return validators.url(url) if url else False
-        
-    def _normalize_url(self, url):
-        """
-        Extract the base domain from a URL.
-        
-        Args:
-            url: URL to normalize
-            
-        Returns:
-            Base URL as scheme://domain
-        """
-        try:
-            parsed = urlparse(url)
-            return f"{parsed.scheme}://{parsed.netloc}"
-        except Exception as e:
-            print(f"Error parsing URL {url}: {e}")
-            return url
-    
     def _process_website(self, url):
         """
         Process a single website to detect license information.
@@ -78,12 +86,12 @@ class LicenseDetector:
         }
 
         # Validate the URL format
-        if not self._validate_url(url):
+        if not _validate_url(url):
             result["invalidUrl"] = True
             return result
 
         # Normalize URL to base domain
-        base_url = self._normalize_url(url)
+        base_url = _normalize_url(url)
         print(f"Processing domain: {base_url}")
 
         # Check robots.txt
@@ -118,34 +126,124 @@ class LicenseDetector:
         
         return result
 
+    def _get_cached_result(self, url):
+        """
+        Get a previously detected result of a website from the result cache.
+        
+        Args:
+            url: The website URL
+            
+        Returns:
+            Dictionary containing license detection results, or None if not cached
+        """
+        if not self.result_cache:
+            return None
+            
+        try:
+            return self.result_cache.get_license_result(url)
+        except Exception as e:
+            print(f"Error reading cached result for {url}: {e}")
+            return None
+
+    def _cache_result(self, url, result):
+        """
+        Store the result of a website in the result cache.
+        
+        Only results that are not caused by a transient failure are cached,
+        i.e. websites whose content was extracted or that robots.txt blocks.
+        
+        Args:
+            url: The website URL
+            result: Dictionary containing license detection results
+        """
+        if not self.result_cache:
+            return
+        if not result["content"] and not result["blockedByRobotsTxt"]:
+            return
+            
+        try:
+            self.result_cache.store_license_result(url, result)
+        except Exception as e:
+            print(f"Error caching result for {url}: {e}")
+
+    def _safe_process_website(self, url):
+        """
+        Process a single website, turning unexpected errors into an error result.
+        
+        Args:
+            url: The website URL to process
+            
+        Returns:
+            Dictionary containing license detection results or the error
+        """
+        cached = self._get_cached_result(url)
+        if cached:
+            print(f"{url} served from cache.")
+            return cached
+            
+        print(f"Crawling: {url}")
+        try:
+            result = self._process_website(url)
+            print(f"{url} processed.")
+            self._cache_result(url, result)
+            return result
+        except Exception as e:
+            print(f"Unexpected error processing {url}: {e}")
+            return {
+                "website": url,
+                "error": str(e),
+            }
+
     def scan_websites(self, sites):
         """
         Scan a list of websites for license information.
         
+        Websites are processed concurrently, the results keep the order of
+        the input list.
+        
         Args:
             sites: List of website URLs to scan
             
         Returns:
             List of dictionaries containing license detection results for each website
         """
-        self.all_data = []
-        
         if not sites:
+            self.all_data = []
             return self.all_data
             
-        for url in sites:
-            print(f"Crawling: {url}")
-            try:
-                result = self._process_website(url)
-                self.all_data.append(result)
-                print(f"{url} processed.")
-            except Exception as e:
-                print(f"Unexpected error processing {url}: {e}")
-                
-                self.all_data.append({
-                    "website": url,
-                    "error": str(e),
-                })
+        # Results are collected locally so concurrent scans don't share a list
+        max_workers = min(MAX_SCAN_WORKERS, len(sites))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._safe_process_website, sites))
                 
         print("All websites processed.")
-        return self.all_data
\ No newline at end of file
+        self.all_data = results
+        return results
+
+    def scan_websites_iter(self, sites):
+        """
+        Scan a list of websites for license information, yielding each result as soon as it is ready.
+        
+        Websites are processed concurrently, so the results are yielded in
+        the order the scans finish rather than the order of the input list.
+        Scans that have not started yet are cancelled when the generator is
+        closed early.
+        
+        Args:
+            sites: List of website URLs to scan
+            
+        Yields:
+            Dictionary containing license detection results for a website
+        """
+        if not sites:
+            return
+            
+        executor = ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(sites)))
+        try:
+            futures = [executor.submit(self._safe_process_website, url) for url in sites]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+            
+        print("All websites processed.")
\ No newline at end of file
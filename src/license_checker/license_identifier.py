@@ -1,11 +1,26 @@
 import re
-from license_checker.parameters import CC_VERSIONS, CC_TYPES, CC_TYPE_MAP, LICENSE_PATTERNS
+import hashlib
+import threading
+from collections import OrderedDict
+from license_checker.parameters import (
+    CC_TOKEN_MAP, CC_TRIGGER_PATTERN, CC_URL_PATTERN, IDENTIFIER_CACHE_SIZE, LICENSE_PATTERNS,
+    LICENSE_GROUP_NAMES, LICENSE_MENTIONS_PATTERN, LICENSE_TRIGGER_PATTERN
+)
 
 class LicenseIdentifier:
     """
     This class provides functionality to detect Creative Commons licenses
     and extract license mentions from text.
     """
+
+    def __init__(self):
+        """
+        Initialize the LicenseIdentifier.
+        """
+        # LRU cache of results keyed by the method and a digest of its arguments,
+        # so rescanned pages are not matched against the patterns again
+        self.results_cache = OrderedDict()
+        self.results_cache_lock = threading.Lock()
     
     def determine_cc_license(self, url, text):
         """
@@ -21,6 +36,20 @@ class LicenseIdentifier:
         if not url and not text:
             return "Unknown"
 
+        key = ("cc", url or "", self._digest(text))
+        return self._cached(key, lambda: self._determine_cc_license(url, text))
+
+    def _determine_cc_license(self, url, text):
+        """
+        Determine the Creative Commons license without using the results cache.
+        
+        Args:
+            url: The URL that might contain license information
+            text: The text that might mention a license
+            
+        Returns:
+            A string representing the identified CC license or "Unknown" if not found.
+        """
         url_lower = url.lower() if url else ""
         text_lower = text.lower() if text else ""
 
@@ -63,11 +92,10 @@ class LicenseIdentifier:
         Returns:
             License string if found, None otherwise
         """
-        for version in CC_VERSIONS:
-            for cc_type in CC_TYPES:
-                cc_pattern_url = f"licenses/{cc_type.lower()}/{version}"
-                if cc_pattern_url in url_lower:
-                    return f"CC-{cc_type}-{version}"
+        match = CC_URL_PATTERN.search(url_lower)
+        if match:
+            cc_type, version = match.groups()
+            return f"CC-{cc_type.upper()}-{version}"
         return None
     
     def _extract_license_from_text(self, text_lower):
@@ -80,6 +108,9 @@ class LicenseIdentifier:
         Returns:
             License string if found, None otherwise
         """
+        if not self._contains_trigger(text_lower, CC_TRIGGER_PATTERN):
+            return None
+
         try:
             cc_pattern = LICENSE_PATTERNS["Creative Commons (CC)"]
             match = cc_pattern.search(text_lower)
@@ -107,18 +138,8 @@ class LicenseIdentifier:
         if not type_str:
             return ""
         
-        type_str = type_str.lower().replace('-', ' ')
-        words = type_str.split()
-        mapped_words = []
-        
-        for word in words:
-            if word in CC_TYPE_MAP:
-                mapped_words.append(CC_TYPE_MAP[word])
-                has_cc_type = True
-            elif word in CC_VERSIONS:
-                mapped_words.append(word)
-        
-        return '-'.join(mapped_words)
+        words = type_str.lower().replace('-', ' ').split()
+        return '-'.join(CC_TOKEN_MAP[word] for word in words if word in CC_TOKEN_MAP)
 
     def extract_licenses(self, text):
         """
@@ -128,17 +149,81 @@ class LicenseIdentifier:
             text: The text to search for license mentions
             
         Returns:
-            A list of license names found in the text
+            A sorted list of license names found in the text
         """
-        if not text:
+        if not text or not self._contains_trigger(text.lower(), LICENSE_TRIGGER_PATTERN):
             return []
+
+        key = ("mentions", self._digest(text))
+        return list(self._cached(key, lambda: self._extract_licenses(text)))
+
+    def _extract_licenses(self, text):
+        """
+        Extract license mentions without using the results cache.
+        
+        Args:
+            text: The text to search for license mentions
             
+        Returns:
+            A sorted tuple of license names found in the text
+        """
         licenses = set()
-        try:
-            for pattern_name, pattern in LICENSE_PATTERNS.items():
-                if pattern.search(text):
-                    licenses.add(pattern_name)
-        except Exception:
-            pass
+        for match in LICENSE_MENTIONS_PATTERN.finditer(text):
+            licenses.add(LICENSE_GROUP_NAMES[match.lastgroup])
+            if len(licenses) == len(LICENSE_GROUP_NAMES):
+                break
+            
+        return tuple(sorted(licenses))
+
+    def _contains_trigger(self, text_lower, trigger_pattern):
+        """
+        Check if lowercase text contains any of the trigger words.
+        
+        The trigger pattern is much cheaper than the license patterns, so text
+        that cannot match a pattern is rejected without running it.
+        
+        Args:
+            text_lower: Lowercase text to check
+            trigger_pattern: Compiled pattern of the words every pattern match starts with
             
-        return list(licenses)
\ No newline at end of file
+        Returns:
+            True if any trigger word is found, False otherwise
+        """
+        return trigger_pattern.search(text_lower) is not None
+
+    def _digest(self, text):
+        """
+        Compute a short digest of text used in cache keys.
+        
+        Keying by the digest keeps the cache from holding whole pages in memory.
+        
+        Args:
+            text: The text to digest, possibly empty or None
+            
+        Returns:
+            Bytes digest of the text
+        """
+        return hashlib.blake2b((text or "").encode(), digest_size=16).digest()
+
+    def _cached(self, key, compute):
+        """
+        Get a result from the results cache, computing and storing it on a miss.
+        
+        Args:
+            key: Cache key of the result
+            compute: Function without arguments computing the result
+            
+        Returns:
+            The cached or newly computed result
+        """
+        with self.results_cache_lock:
+            if key in self.results_cache:
+                self.results_cache.move_to_end(key)
+                return self.results_cache[key]
+
+        result = compute()
+        with self.results_cache_lock:
+            self.results_cache[key] = result
+            if len(self.results_cache) > IDENTIFIER_CACHE_SIZE:
+                self.results_cache.popitem(last=False)
+        return result
\ No newline at end of file
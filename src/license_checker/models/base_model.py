@@ -1,4 +1,12 @@
 from abc import ABC, abstractmethod
+from license_checker.parameters import CHARS_PER_TOKEN, MAX_CONTENT_TOKENS
+import re
+
+# Runs of whitespace collapsed to a single space in the content sent to the model
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Numbered answer in a response to a prompt with several questions, e.g. "A1: ..."
+ANSWER_PATTERN = re.compile(r'^A(\d+):\s*(.*?)(?=^A\d+:|\Z)', re.MULTILINE | re.DOTALL)
 
 class BaseModel(ABC):
     """    
@@ -6,6 +14,9 @@ class BaseModel(ABC):
     including methods for summarizing Terms of Service text and answering questions
     about them.
     """
+
+    # Line separating the summaries in a response to a batched prompt
+    BATCH_SEPARATOR = "=====SUMMARY====="
     
     def __init__(self, model_name, api_key=None):
         """
@@ -17,15 +28,46 @@ class BaseModel(ABC):
         """
         self.model_name = model_name
         self.api_key = api_key
+        # API client reused by all requests, together with the API key it was created for
+        self._client = None
+        self._client_key = None
 
     def set_api_key(self, api_key):
         """
         Set or update the API key for the model.
         
+        The API client created for the previous key is discarded.
+        
         Args:
             api_key (str): The API key for accessing the model service
         """
         self.api_key = api_key
+        self._client = None
+        self._client_key = None
+
+    def _get_client(self):
+        """
+        Get the API client, creating it on first use or after the API key changed.
+        
+        Returns:
+            object: The API client configured with the current API key
+        """
+        if self._client is None or self._client_key != self.api_key:
+            self._client = self._create_client()
+            self._client_key = self.api_key
+        return self._client
+
+    def _create_client(self):
+        """
+        Create an API client configured with the current API key.
+        
+        Returns:
+            object: The API client of the model service
+            
+        Raises:
+            NotImplementedError: If the model does not use a reusable API client
+        """
+        raise NotImplementedError("Model does not provide an API client")
 
     def _prepare_prompt(self, data, question=None):
         """
@@ -43,7 +85,104 @@ class BaseModel(ABC):
                 f"Summary of the Terms of Service text:\n{data['summary']}\n\n"
                 f"Answer the following question about the ToS summary:\n{question}"
             )
-        return f"Summarize the following Terms of Service text from {data['website']}:\n{data['content']}"
+        return (
+            f"Summarize the following Terms of Service text from {data['website']}:\n"
+            f"{self._prepare_content(data['content'])}"
+        )
+
+    def _prepare_batch_prompt(self, data_list):
+        """
+        Prepare a single prompt asking for summaries of several ToS texts.
+        
+        Args:
+            data_list (list): Dictionaries containing website data with content
+            
+        Returns:
+            str: Formatted prompt ready to be sent to the language model
+        """
+        documents = "\n\n".join(
+            f"Document {index}: Terms of Service text from {data['website']}:\n"
+            f"{self._prepare_content(data['content'])}"
+            for index, data in enumerate(data_list, start=1)
+        )
+        return (
+            f"Summarize each of the following {len(data_list)} Terms of Service texts separately. "
+            f"Output the summaries in the same order as the documents, separated by a line "
+            f"containing only {self.BATCH_SEPARATOR}, without any other text.\n\n{documents}"
+        )
+
+    def _prepare_questions_prompt(self, data, questions):
+        """
+        Prepare a single prompt asking several questions about the ToS summary.
+        
+        Args:
+            data (dict): Dictionary containing website data with summary
+            questions (list): Questions to be asked about the ToS
+            
+        Returns:
+            str: Formatted prompt ready to be sent to the language model
+        """
+        numbered_questions = "\n".join(
+            f"Q{index}: {question}" for index, question in enumerate(questions, start=1)
+        )
+        return (
+            f"Summary of the Terms of Service text:\n{data['summary']}\n\n"
+            f"Answer each of the following questions about the ToS summary. Start the answer "
+            f"to question Q<n> on a new line with A<n>:, without any other text.\n{numbered_questions}"
+        )
+
+    def _split_answers_response(self, text, questions):
+        """
+        Split the response to a prompt with several questions into the individual answers.
+        
+        Args:
+            text (str): Response of the language model to the questions prompt
+            questions (list): Questions the answers belong to
+            
+        Returns:
+            list: The answers in the order of the questions, or None if the
+                  response does not contain exactly one answer per question
+        """
+        answers = {int(number): answer.strip() for number, answer in ANSWER_PATTERN.findall(text)}
+        if sorted(answers) != list(range(1, len(questions) + 1)):
+            return None
+        return [answers[number] for number in range(1, len(questions) + 1)]
+
+    def _prepare_content(self, content):
+        """
+        Compact the ToS content and truncate it to the token budget.
+        
+        The number of tokens is estimated from the number of characters,
+        so long pages are cut without running a tokenizer.
+        
+        Args:
+            content (str): ToS content of a website
+            
+        Returns:
+            str: Content with collapsed whitespace, at most MAX_CONTENT_TOKENS tokens long
+        """
+        content = WHITESPACE_PATTERN.sub(" ", content).strip()
+        return content[:MAX_CONTENT_TOKENS * CHARS_PER_TOKEN]
+
+    def _split_batch_response(self, text, data_list):
+        """
+        Split the response to a batched prompt into the individual summaries.
+        
+        Args:
+            text (str): Response of the language model to the batched prompt
+            data_list (list): Dictionaries containing website data the summaries belong to
+            
+        Returns:
+            list: The data dictionaries with added 'summary' field, or None if the
+                  response does not contain exactly one summary per document
+        """
+        summaries = [part.strip() for part in text.split(self.BATCH_SEPARATOR) if part.strip()]
+        if len(summaries) != len(data_list):
+            return None
+
+        for data, summary in zip(data_list, summaries):
+            data['summary'] = summary
+        return data_list
 
     def _validate_summary_data(self, data):
         """
@@ -94,6 +233,22 @@ class BaseModel(ABC):
         if not self.api_key:
             raise ValueError("API key is not set")
 
+    def summarize_many(self, data_list):
+        """
+        Summarize several Terms of Service texts.
+        
+        Implementing classes may override this method to summarize all texts
+        with a single request to the model. By default each text is
+        summarized separately.
+        
+        Args:
+            data_list (list): Dictionaries containing website data with content to summarize
+            
+        Returns:
+            list: Updated data dictionaries with added 'summary' field, in the same order
+        """
+        return [self.summarize(data) for data in data_list]
+
     @abstractmethod
     def answer_question(self, data, question):
         """
@@ -111,4 +266,21 @@ class BaseModel(ABC):
             NotImplementedError: If the implementing class does not override this method
         """
         if not self.api_key:
-            raise ValueError("API key is not set")
\ No newline at end of file
+            raise ValueError("API key is not set")
+
+    def answer_questions(self, data, questions):
+        """
+        Answer several questions about Terms of Service summary.
+        
+        Implementing classes may override this method to answer all questions
+        with a single request to the model. By default each question is
+        answered separately.
+        
+        Args:
+            data (dict): Dictionary containing website data with summary
+            questions (list): Questions to answer about the Terms of Service
+            
+        Returns:
+            list: Answers to the questions, in the same order
+        """
+        return [self.answer_question(data, question) for question in questions]
\ No newline at end of file
@@ -1,5 +1,7 @@
 from .base_model import BaseModel
 from google import genai
+from google.genai import types
+from license_checker.parameters import LLM_REQUEST_TIMEOUT
 import requests
 
 class Gemini(BaseModel):
@@ -20,6 +22,18 @@ class Gemini(BaseModel):
         """
         super().__init__('gemini-2.5-pro-exp-03-25', api_key)
 
+    def _create_client(self):
+        """
+        Create a Google AI API client configured with the current API key.
+        
+        Returns:
+            genai.Client: The API client
+        """
+        return genai.Client(
+            api_key=self.api_key,
+            http_options=types.HttpOptions(timeout=LLM_REQUEST_TIMEOUT * 1000),
+        )
+
     def summarize(self, data):
         """
         Summarize Terms of Service text using the Gemini model.
@@ -38,7 +52,7 @@ class Gemini(BaseModel):
         super().summarize(data)
         
         self._validate_summary_data(data)
-        client = genai.Client(api_key=self.api_key)
+        client = self._get_client()
 
         try:
             response = client.models.generate_content(
@@ -51,6 +65,45 @@ class Gemini(BaseModel):
 
         return data
 
+    def summarize_many(self, data_list):
+        """
+        Summarize several Terms of Service texts with a single Gemini request.
+        
+        Falls back to summarizing each text separately if the response cannot
+        be split into one summary per text.
+        
+        Args:
+            data_list (list): Dictionaries containing website data with content to summarize
+            
+        Returns:
+            list: Updated data dictionaries with added 'summary' field, in the same order
+            
+        Raises:
+            ValueError: If the data validation fails, the API key is invalid or not set
+        """
+        if len(data_list) < 2:
+            return super().summarize_many(data_list)
+
+        # Call parent method to check if API key is set
+        super().summarize(data_list[0])
+        
+        for data in data_list:
+            self._validate_summary_data(data)
+        client = self._get_client()
+
+        try:
+            response = client.models.generate_content(
+                model=self.model_name,
+                contents=self._prepare_batch_prompt(data_list),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to generate summary: {str(e)}")
+
+        summaries = self._split_batch_response(response.text, data_list)
+        if summaries is None:
+            return super().summarize_many(data_list)
+        return summaries
+
     def answer_question(self, data, question):
         """
         Answer a question about Terms of Service summary using the Gemini model.
@@ -70,7 +123,7 @@ class Gemini(BaseModel):
         super().answer_question(data, question)
         
         self._validate_question_data(data, question)
-        client = genai.Client(api_key=self.api_key)
+        client = self._get_client()
 
         try:
             response = client.models.generate_content(
@@ -79,4 +132,43 @@ class Gemini(BaseModel):
             )
             return response.text.strip()
         except Exception as e:
-            raise ValueError(f"Failed to answer question: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Failed to answer question: {str(e)}")
+
+    def answer_questions(self, data, questions):
+        """
+        Answer several questions about Terms of Service summary with a single Gemini request.
+        
+        Falls back to answering each question separately if the response cannot
+        be split into one answer per question.
+        
+        Args:
+            data (dict): Dictionary containing website data with summary
+            questions (list): Questions to answer about the Terms of Service
+            
+        Returns:
+            list: Answers to the questions, in the same order
+            
+        Raises:
+            ValueError: If the data validation fails, the API key is invalid or not set
+        """
+        if len(questions) < 2:
+            return super().answer_questions(data, questions)
+
+        for question in questions:
+            # Call parent method to check if API key is set
+            super().answer_question(data, question)
+            self._validate_question_data(data, question)
+        client = self._get_client()
+
+        try:
+            response = client.models.generate_content(
+                model=self.model_name,
+                contents=self._prepare_questions_prompt(data, questions),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to answer question: {str(e)}")
+
+        answers = self._split_answers_response(response.text, questions)
+        if answers is None:
+            return super().answer_questions(data, questions)
+        return answers
\ No newline at end of file
@@ -1,6 +1,7 @@
 from .base_model import BaseModel
 from huggingface_hub import InferenceClient
 from huggingface_hub.errors import HfHubHTTPError
+from license_checker.parameters import LLM_REQUEST_TIMEOUT
 
 class Mistral(BaseModel):
     """
@@ -20,6 +21,15 @@ class Mistral(BaseModel):
         """
         super().__init__('mistralai/Mixtral-8x7B-Instruct-v0.1', api_key)
 
+    def _create_client(self):
+        """
+        Create a Hugging Face inference client configured with the current API key.
+        
+        Returns:
+            InferenceClient: The API client
+        """
+        return InferenceClient(model=self.model_name, token=self.api_key, timeout=LLM_REQUEST_TIMEOUT)
+
     def summarize(self, data):
         """
         Summarize Terms of Service text using the Mistral model.
@@ -37,7 +47,7 @@ class Mistral(BaseModel):
         super().summarize(data)
         
         self._validate_summary_data(data)
-        client = InferenceClient(model=self.model_name, token=self.api_key)
+        client = self._get_client()
 
         try:
             response = client.text_generation(
@@ -52,6 +62,47 @@ class Mistral(BaseModel):
         data['summary'] = response.strip()
         return data
 
+    def summarize_many(self, data_list):
+        """
+        Summarize several Terms of Service texts with a single Mistral request.
+        
+        Falls back to summarizing each text separately if the response cannot
+        be split into one summary per text.
+        
+        Args:
+            data_list (list): Dictionaries containing website data with content to summarize
+            
+        Returns:
+            list: Updated data dictionaries with added 'summary' field, in the same order
+            
+        Raises:
+            ValueError: If the data validation fails, the API key is invalid or not set
+        """
+        if len(data_list) < 2:
+            return super().summarize_many(data_list)
+
+        # Call parent method to check if API key is set
+        super().summarize(data_list[0])
+        
+        for data in data_list:
+            self._validate_summary_data(data)
+        client = self._get_client()
+
+        try:
+            response = client.text_generation(
+                prompt=self._prepare_batch_prompt(data_list),
+                temperature=0.2,
+                max_new_tokens=1000 * len(data_list),
+                return_full_text=False
+            )
+        except HfHubHTTPError:
+            raise ValueError("Invalid API key: Failed to authenticate with Hugging Face API")
+
+        summaries = self._split_batch_response(response, data_list)
+        if summaries is None:
+            return super().summarize_many(data_list)
+        return summaries
+
     def answer_question(self, data, question):
         """
         Answer a question about Terms of Service summary using the Mistral model.
@@ -70,7 +121,7 @@ class Mistral(BaseModel):
         super().answer_question(data, question)
         
         self._validate_question_data(data, question)
-        client = InferenceClient(model=self.model_name, token=self.api_key)
+        client = self._get_client()
         try:
             response = client.text_generation(
                 prompt=self._prepare_prompt(data, question),
@@ -81,4 +132,45 @@ class Mistral(BaseModel):
         except HfHubHTTPError:
             raise ValueError("Invalid API key: Failed to authenticate with Hugging Face API")
 
-        return response.strip()
\ No newline at end of file
+        return response.strip()
+
+    def answer_questions(self, data, questions):
+        """
+        Answer several questions about Terms of Service summary with a single Mistral request.
+        
+        Falls back to answering each question separately if the response cannot
+        be split into one answer per question.
+        
+        Args:
+            data (dict): Dictionary containing website data with summary
+            questions (list): Questions to answer about the Terms of Service
+            
+        Returns:
+            list: Answers to the questions, in the same order
+            
+        Raises:
+            ValueError: If the data validation fails, the API key is invalid or not set
+        """
+        if len(questions) < 2:
+            return super().answer_questions(data, questions)
+
+        for question in questions:
+            # Call parent method to check if API key is set
+            super().answer_question(data, question)
+            self._validate_question_data(data, question)
+        client = self._get_client()
+
+        try:
+            response = client.text_generation(
+                prompt=self._prepare_questions_prompt(data, questions),
+                temperature=0.4,
+                max_new_tokens=1000 * len(questions),
+                return_full_text=False
+            )
+        except HfHubHTTPError:
+            raise ValueError("Invalid API key: Failed to authenticate with Hugging Face API")
+
+        answers = self._split_answers_response(response, questions)
+        if answers is None:
+            return super().answer_questions(data, questions)
+        return answers
\ No newline at end of file
@@ -27,7 +27,8 @@ class ModelManager:
             model_name (str): The name/identifier of the model to instantiate.
                              Must be one of the keys in the models dictionary.
             api_key (str, optional): API key for the model. If provided, it will
-                                    be stored within the model instance.
+                                    be stored within the model instance. The stored
+                                    instance is reused while the key is unchanged.
         
         Returns:
             object: An instance of the requested model class if the model_name is valid,
@@ -37,17 +38,14 @@ class ModelManager:
         if not model_class:
             return None
             
-        # If the model was previously instantiated and no new API key is provided,
-        # return the existing instance
-        if model_name in self.model_instances and api_key is None:
-            return self.model_instances[model_name]
+        # Reuse the existing instance if no new API key is provided or the key is unchanged
+        model_instance = self.model_instances.get(model_name)
+        if model_instance is not None and (api_key is None or model_instance.api_key == api_key):
+            return model_instance
             
-        # Create a new instance with the API key if provided
+        # Create a new instance with the API key if provided and store it
         model_instance = model_class(api_key)
-        
-        # Store the instance if an API key was provided
-        if api_key is not None:
-            self.model_instances[model_name] = model_instance
+        self.model_instances[model_name] = model_instance
             
         return model_instance
         
@@ -3,6 +3,49 @@ import re
 # Default User-Agent
 USER_AGENT = "MyCrawler/1.0"
 
+# HTTP (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Connection pool sizes of the HTTP session
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Maximum number of bytes read from a page, larger pages are truncated
+MAX_PAGE_BYTES = 2_000_000
+PAGE_CHUNK_SIZE = 65536
+
+# Maximum number of pages and total bytes of their bodies kept by RequestManager for conditional requests
+PAGE_CACHE_SIZE = 256
+PAGE_CACHE_MAX_BYTES = 32_000_000
+
+# Retry policy for failed HTTP requests
+RETRY_TOTAL = 2
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# Number of hosts whose parsed robots.txt is cached and for how many seconds
+ROBOTS_CACHE_SIZE = 1024
+ROBOTS_CACHE_TTL = 3600
+
+# Number of distinct robots.txt bodies whose parsed form is shared by all managers
+ROBOTS_PARSE_CACHE_SIZE = 512
+
+# Number of license identification results cached, keyed by a digest of the analyzed text
+IDENTIFIER_CACHE_SIZE = 4096
+
+# Timeout in seconds of a single language model API request
+LLM_REQUEST_TIMEOUT = 120
+
+# Token budget of the ToS content sent to a language model, estimated as characters per token
+MAX_CONTENT_TOKENS = 12000
+CHARS_PER_TOKEN = 4
+
+# Maximum number of websites scanned concurrently
+MAX_SCAN_WORKERS = 16
+
+# Maximum number of relevant links of a website fetched concurrently
+MAX_LINK_WORKERS = 8
+
 # Regex patterns for license detection
 LICENSE_PATTERNS = {
     "MIT License": re.compile(
@@ -100,6 +143,34 @@ LICENSE_PATTERNS = {
     ),
 }
 
+# All license patterns combined, to check whether a text mentions any license in a single pass
+COMBINED_LICENSE_PATTERN = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in LICENSE_PATTERNS.values()),
+    re.IGNORECASE
+)
+
+# Group names of the license patterns in LICENSE_MENTIONS_PATTERN mapped to the license names
+LICENSE_GROUP_NAMES = {f"license{index}": name for index, name in enumerate(LICENSE_PATTERNS)}
+
+# All license patterns as named alternatives inside a lookahead, so a single finditer pass
+# reports every license whose pattern matches, even where the matches of two licenses overlap
+LICENSE_MENTIONS_PATTERN = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{group}>{LICENSE_PATTERNS[name].pattern})" for group, name in LICENSE_GROUP_NAMES.items()
+    ) + ")",
+    re.IGNORECASE
+)
+
+# Matched against lowercase text, every match of LICENSE_PATTERNS starts with one of these words,
+# so text without any of them is skipped before running the patterns. Words are bounded, since
+# bare substrings such as "mit" or "cc" occur in common words like "submit" or "account"
+LICENSE_TRIGGER_PATTERN = re.compile(
+    r"\b(?:mit\b|apache\b|cc[\s\-0]|creative\b|gnu\b|[al]?gpl|general\s+public|bsd\b)"
+)
+
+# Matched against lowercase text, every match of the Creative Commons pattern starts with one of these
+CC_TRIGGER_PATTERN = re.compile(r"\b(?:cc[\s\-0]|creative\b)")
+
 # Versions of CC licenses
 CC_VERSIONS = ['1.0', '2.0', '2.5', '3.0', '4.0']
 
@@ -113,6 +184,14 @@ CC_TYPES = [
     'BY-NC-ND',
 ]
 
+# URL path of CC licenses capturing the license type and version, e.g. licenses/by-sa/4.0
+CC_URL_PATTERN = re.compile(
+    r'licenses/'
+    r'(' + '|'.join(re.escape(cc_type.lower()) for cc_type in CC_TYPES) + r')'
+    r'/'
+    r'(' + '|'.join(re.escape(version) for version in CC_VERSIONS) + r')'
+)
+
 # Mapping of CC license types
 CC_TYPE_MAP = {
     'attribution': 'BY',
@@ -128,12 +207,15 @@ CC_TYPE_MAP = {
     'nd': 'ND',
 }
 
+# Words of CC license text mapped to their part of the standardized license name
+CC_TOKEN_MAP = {**CC_TYPE_MAP, **{version: version for version in CC_VERSIONS}}
+
 # Relevant links based on keywords
 RELEVANT_LINKS_KEYWORDS = [
     "terms",
     "legal",
     "license",
-    "licensing"
+    "licensing",
     "use",
     "policy",
     "copyright",
@@ -155,4 +237,28 @@ RELEVANT_TEXT_KEYWORDS = [
     "apache",
     "mit",
     "bsd",
-]
\ No newline at end of file
+]
+
+def _compile_keywords(keywords):
+    """
+    Compile a list of keywords into a single case-insensitive pattern.
+    
+    Only the presence of a keyword matters, so keywords containing another
+    keyword (e.g. "copyright" containing "right") are left out of the pattern.
+    
+    Args:
+        keywords: List of keywords to match
+        
+    Returns:
+        Compiled regex pattern matching any of the keywords
+    """
+    keywords = {keyword.lower() for keyword in keywords}
+    minimal = sorted(
+        keyword for keyword in keywords
+        if not any(other != keyword and other in keyword for other in keywords)
+    )
+    return re.compile("|".join(re.escape(keyword) for keyword in minimal), re.IGNORECASE)
+
+# Keyword lists compiled once, so each text is scanned for all keywords in a single pass
+RELEVANT_LINKS_PATTERN = _compile_keywords(RELEVANT_LINKS_KEYWORDS)
+RELEVANT_TEXT_PATTERN = _compile_keywords(RELEVANT_TEXT_KEYWORDS)
\ No newline at end of file
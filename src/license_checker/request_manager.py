@@ -1,30 +1,131 @@
 import requests
-from urllib.parse import urljoin
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import urljoin, urlparse
 from protego import Protego
-from license_checker.parameters import USER_AGENT
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from license_checker.parameters import (
+    USER_AGENT, REQUEST_TIMEOUT, POOL_CONNECTIONS, POOL_MAXSIZE,
+    RETRY_TOTAL, RETRY_BACKOFF_FACTOR, RETRY_STATUS_CODES, ROBOTS_CACHE_SIZE, ROBOTS_CACHE_TTL,
+    ROBOTS_PARSE_CACHE_SIZE, MAX_PAGE_BYTES, PAGE_CHUNK_SIZE,
+    PAGE_CACHE_SIZE, PAGE_CACHE_MAX_BYTES
+)
+
+@lru_cache(maxsize=ROBOTS_PARSE_CACHE_SIZE)
+def _parse_robots(body):
+    """
+    Parse a robots.txt body, sharing the result for identical bodies.
+    
+    The parsed object is only queried with can_fetch, so one instance can
+    be shared by all managers and threads.
+    
+    Args:
+        body (str): Content of the robots.txt file
+        
+    Returns:
+        Protego: The parsed robots.txt object
+    """
+    return Protego.parse(body)
 
 class RequestManager:
     """
     This class handles making HTTP requests to websites while respecting robots.txt
     rules and providing user agent management.
     """
-    def __init__(self, user_agent):
+    def __init__(self, user_agent, page_cache_size=PAGE_CACHE_SIZE, page_cache_bytes=PAGE_CACHE_MAX_BYTES):
         """
         Initialize a RequestManager with the specified user agent.
         
         Args:
             user_agent (str): The user agent string to use for requests.
                              If None, the default from config will be used.
+            page_cache_size (int): Maximum number of pages kept for
+                                   conditional requests (default: PAGE_CACHE_SIZE).
+            page_cache_bytes (int): Maximum total size of the kept page bodies
+                                    in bytes (default: PAGE_CACHE_MAX_BYTES).
         """
-        self.session = requests.Session()
+        self.session = self._create_session()
         self.user_agent = user_agent or USER_AGENT
+        self.page_cache = OrderedDict()
+        self.page_cache_size = page_cache_size
+        self.page_cache_bytes = page_cache_bytes
+        # Total size of the page bodies in page_cache
+        self.page_cache_used = 0
+        # Websites may be scanned from several threads sharing this manager
+        self.page_cache_lock = threading.Lock()
+        # Parsed robots.txt (or None if unavailable) and fetch time per scheme://host
+        self.robots_cache = OrderedDict()
+        self.robots_cache_lock = threading.Lock()
         
         self.session.headers.update({"User-Agent": self.user_agent})
 
+    def _create_session(self):
+        """
+        Create an HTTP session with connection pooling and retries.
+        
+        Returns:
+            requests.Session: Session reusing connections across requests.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=RETRY_TOTAL,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES,
+                raise_on_status=False,
+                # Retry-After is unbounded, a long one would block a scan thread, the backoff spaces retries
+                respect_retry_after_header=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Only advertise encodings urllib3 can decode, br is included when brotli is installed
+        session.headers.update({
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+            "Connection": "keep-alive",
+        })
+        return session
+
     def fetch_robots(self, url):
         """
         Fetch the robots.txt file from a given URL.
         
+        The parsed robots.txt of each host is cached for ROBOTS_CACHE_TTL
+        seconds, including hosts without a robots.txt, so it is downloaded
+        only once for all URLs of the host.
+        
+        Args:
+            url (str): The base URL to fetch robots.txt from.
+            
+        Returns:
+            Protego: A parsed robots.txt object, or None if not available.
+        """
+        parsed = urlparse(url)
+        host = f"{parsed.scheme}://{parsed.netloc}"
+        with self.robots_cache_lock:
+            cached = self.robots_cache.get(host)
+            if cached and time.monotonic() - cached[1] < ROBOTS_CACHE_TTL:
+                self.robots_cache.move_to_end(host)
+                return cached[0]
+
+        robots = self._download_robots(url)
+        with self.robots_cache_lock:
+            self.robots_cache[host] = (robots, time.monotonic())
+            self.robots_cache.move_to_end(host)
+            if len(self.robots_cache) > ROBOTS_CACHE_SIZE:
+                self.robots_cache.popitem(last=False)
+        return robots
+
+    def _download_robots(self, url):
+        """
+        Download and parse the robots.txt file from a given URL.
+        
         Args:
             url (str): The base URL to fetch robots.txt from.
             
@@ -32,9 +133,9 @@ class RequestManager:
             Protego: A parsed robots.txt object, or None if not available.
         """
         try:
-            response = self.session.get(urljoin(url, "/robots.txt"), timeout=10)
+            response = self.session.get(urljoin(url, "/robots.txt"), timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                return Protego.parse(response.text)
+                return _parse_robots(response.text)
         except requests.RequestException as e:
             print(f"Failed to fetch robots.txt for {url}: {e}")
         except Exception as e:
@@ -61,6 +162,12 @@ class RequestManager:
         """
         Fetch the content of a webpage.
         
+        Pages served with an ETag or Last-Modified header are cached, and
+        later fetches of the same URL are sent as conditional requests so
+        an unchanged page is not downloaded again. The body is streamed and
+        reading stops after MAX_PAGE_BYTES, so huge pages are truncated
+        instead of being loaded into memory whole.
+        
         Args:
             url (str): The URL to fetch the content from.
             
@@ -70,10 +177,75 @@ class RequestManager:
         if not url:
             return None
             
-        response = self.session.get(url, timeout=10)
-        response.raise_for_status()
-        return response.content
+        headers = {}
+        with self.page_cache_lock:
+            cached = self.page_cache.get(url)
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        with self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            if cached and response.status_code == 304:
+                with self.page_cache_lock:
+                    if url in self.page_cache:
+                        self.page_cache.move_to_end(url)
+                return cached["content"]
+
+            response.raise_for_status()
+            content = self._read_content(response)
+        self._cache_page(url, response, content)
+        return content
+
+    def _read_content(self, response, max_bytes=MAX_PAGE_BYTES):
+        """
+        Read the decoded body of a streamed response up to a size limit.
+        
+        Args:
+            response (requests.Response): The streamed response to read.
+            max_bytes (int): Maximum number of bytes to read.
+            
+        Returns:
+            bytes: The body of the response, truncated to max_bytes.
+        """
+        content = bytearray()
+        for chunk in response.iter_content(PAGE_CHUNK_SIZE):
+            content.extend(chunk)
+            if len(content) >= max_bytes:
+                break
+        return bytes(content[:max_bytes])
+
+    def _cache_page(self, url, response, content):
+        """
+        Store a fetched page for later conditional requests.
+        
+        The least recently used pages are evicted once the cache holds more
+        than page_cache_size pages or page_cache_bytes bytes of content.
+        
+        Args:
+            url (str): The URL the page was fetched from.
+            response (requests.Response): The response the page was read from.
+            content (bytes): The content of the page.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self.page_cache_lock:
+            previous = self.page_cache.pop(url, None)
+            if previous:
+                self.page_cache_used -= len(previous["content"])
+            if (not etag and not last_modified) or len(content) > self.page_cache_bytes:
+                return
 
+            self.page_cache[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "content": content,
+            }
+            self.page_cache_used += len(content)
+            while len(self.page_cache) > self.page_cache_size or self.page_cache_used > self.page_cache_bytes:
+                _, evicted = self.page_cache.popitem(last=False)
+                self.page_cache_used -= len(evicted["content"])
 
     def set_user_agent(self, user_agent):
         """
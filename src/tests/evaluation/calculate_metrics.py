@@ -1,20 +1,87 @@
 from langchain_core.prompts import PromptTemplate
-from bert_score import score
+from bert_score import BERTScorer
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import repeat
 from rouge_score import rouge_scorer
 from google import genai
+from google.genai import errors, types
+from pydantic import BaseModel
+from typing import Literal
+import asyncio
+import hashlib
 import json
+import numpy as np
 import os
+import random
+import sqlite3
+import tempfile
 import time
+import torch
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(data):
+        return json.dumps(data, indent=2).encode("utf-8")
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 GEMINI_API_KEY = "my_api_key"
-GEMINI_MODEL_NAME = "gemini-2.5-pro-exp-03-25"
+GEMINI_MODEL_NAME = "gemini-2.5-flash"
 
 # Initialize the Gemini client
 gemini_client = genai.Client(api_key=GEMINI_API_KEY)
 
-# Rate limiting variables
+# Structured output of the hallucination check, so the verdict is returned as plain JSON
+class HalluResult(BaseModel):
+    REASONING: str
+    SCORE: Literal["PASS", "FAIL"]
+
+# Offline evaluation tolerates queueing, the flex tier is billed at a discount
+HALLU_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=HalluResult,
+    service_tier="flex"
+)
+
+# Batch jobs are already discounted and take the same output schema in the request file
+HALLU_BATCH_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_json_schema": HalluResult.model_json_schema()
+}
+
+# BERTScore runs on the GPU with fp16 autocast when one is available
+BERT_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+BERT_BATCH_SIZE = 128 if BERT_DEVICE == "cuda" else 64
+
+# Send the hallucination checks as one batch job, or as concurrent rate limited requests if False
+USE_BATCH_API = True
+
+# Rate limit of the concurrent requests
 MAX_REQUESTS_PER_MINUTE = 10
-request_count = 0
+
+# Retries of requests rejected with 429, waiting BACKOFF_BASE * 2^attempt seconds plus jitter
+# unless the response says how long to wait
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 2
+BACKOFF_JITTER = 1
+
+# Verdicts of already checked prompts, so reruns only send changed content and summaries
+VERDICT_CACHE_PATH = "data/_hallu_cache.sqlite"
+
+# Seconds between polls of the hallucination check batch job
+BATCH_POLL_INTERVAL = 30
+BATCH_DONE_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
 
 # Prompt for hallucination check LLM (https://huggingface.co/PatronusAI/Llama-3-Patronus-Lynx-8B-Instruct-v1.1)
 PROMPT = """
@@ -47,92 +114,262 @@ def read_json(file_path):
     dir = os.path.dirname(os.path.abspath(__file__))
     full_file_path = os.path.join(dir, file_path)
     
-    with open(full_file_path, "r", encoding="utf-8") as file:
-        return json.load(file)
+    with open(full_file_path, "rb") as file:
+        return _loads(file.read())
 
 def write_json(file_path, data):
     dir = os.path.dirname(os.path.abspath(__file__))
     full_file_path = os.path.join(dir, file_path)
 
-    with open(full_file_path, "w", encoding="utf-8") as file:
-        json.dump(data, file, indent=4)
+    # Written to a temporary file first, so an interrupted run never leaves a truncated file
+    tmp_file_path = full_file_path + ".tmp"
+    with open(tmp_file_path, "wb") as file:
+        file.write(_dumps(data))
+    os.replace(tmp_file_path, full_file_path)
 
 def split_list(list, n):
-    result = []
     for i in range(0, len(list), n):
-        result.append(list[i:i+n])
-    return result
-
-def extract_data(data):
-    all_mistral = []
-    all_llama2 = []
-    all_refs = []
-    all_contents = []
-    for item in data:
-        n = len(item["summaries_mistral"])
-        all_mistral.extend(item["summaries_mistral"])
+        yield list[i:i+n]
+
+def iter_items(file_path):
+    # Stream the items of the top level array when ijson is available
+    if ijson is None:
+        yield from read_json(file_path)
+        return
+
+    dir = os.path.dirname(os.path.abspath(__file__))
+    full_file_path = os.path.join(dir, file_path)
+
+    with open(full_file_path, "rb") as file:
+        yield from ijson.items(file, "item")
+
+def extract_data(items):
+    # Single pass, so the items can be streamed
+    all_mistral, all_llama2, all_refs, all_contents = [], [], [], []
+    for item in items:
+        mistral = item["summaries_mistral"]
+        all_mistral.extend(mistral)
         all_llama2.extend(item["summaries_llama2"])
-        all_refs.extend([item["summary_reference"]] * n)
+        all_refs.extend(repeat(item["summary_reference"], len(mistral)))
         all_contents.append([item["content"]])
     return all_mistral, all_llama2, all_refs, all_contents
 
-def calculate_bert_scores(candidates, references):
-    P, R, F1 = score(candidates, references, lang="en", verbose=True)
-    return P, R, F1
+def iter_extract(file_path):
+    return extract_data(iter_items(file_path))
+
+def dedup_pairs(candidates, references):
+    # Each distinct (candidate, reference) pair is scored once, inverse maps every pair to its score
+    index = {}
+    inverse = [index.setdefault(pair, len(index)) for pair in zip(candidates, references)]
+    return [cand for cand, _ in index], [ref for _, ref in index], inverse
+
+def calculate_bert_scores(candidate_sets, references):
+    # All candidate sets are scored in one pass, so the model is loaded once and
+    # the embeddings of the shared references are computed only once
+    scorer = BERTScorer(lang="en", device=BERT_DEVICE, batch_size=BERT_BATCH_SIZE, use_fast_tokenizer=True)
+    candidates = [cand for candidate_set in candidate_sets for cand in candidate_set]
+    unique_cands, unique_refs, inverse = dedup_pairs(candidates, references * len(candidate_sets))
+    with torch.autocast("cuda", dtype=torch.float16, enabled=BERT_DEVICE == "cuda"):
+        P, R, F1 = scorer.score(unique_cands, unique_refs, verbose=True)
+    P, R, F1 = P.float(), R.float(), F1.float()
+    P, R, F1 = P[inverse], R[inverse], F1[inverse]
+
+    results = []
+    start = 0
+    for candidate_set in candidate_sets:
+        end = start + len(candidate_set)
+        results.append((P[start:end], R[start:end], F1[start:end]))
+        start = end
+    return results
 
 def calculate_rouge_scores(candidates, references):
     rouge = rouge_scorer.RougeScorer(['rouge1', 'rougeL'], use_stemmer=True)
-    scores = {'rouge1': [], 'rougeL': []}
-    for cand, ref in zip(candidates, references):
-        result = rouge.score(ref, cand)
-        scores['rouge1'].append(result['rouge1'].fmeasure)
-        scores['rougeL'].append(result['rougeL'].fmeasure)
-    return scores
+    # Each distinct pair is scored once, references repeat for each of their summaries
+    unique_cands, unique_refs, inverse = dedup_pairs(candidates, references)
+    unique_scores = {'rouge1': np.empty(len(unique_cands)), 'rougeL': np.empty(len(unique_cands))}
+    for i, (cand, ref) in enumerate(zip(unique_cands, unique_refs)):
+        scores = rouge.score(ref, cand)
+        unique_scores['rouge1'][i] = scores['rouge1'].fmeasure
+        unique_scores['rougeL'][i] = scores['rougeL'].fmeasure
+    return {metric: values[inverse] for metric, values in unique_scores.items()}
 
-def calculate_hallucination_scores(summaries, contents):
-    global request_count
-    results = []
+def build_hallucination_prompts(summaries, contents):
+    prompts = []
     summaries_three = split_list(summaries, 3) # For each content, I created 3 summaries
     for content, summaries in zip(contents, summaries_three):
         for summary in summaries:
-            formatted_prompt = hallucination_check_prompt.format(
+            prompts.append(hallucination_check_prompt.format(
                 question="Summarize the terms of service text.",
                 context=content,
                 answer=summary
-            )
-            
-            if request_count >= MAX_REQUESTS_PER_MINUTE:
-                print(f"Rate limit reached. Waiting for 60 seconds.")
-                time.sleep(60)
-                request_count = 0
-            
-            try:
-                response = gemini_client.models.generate_content(
-                    model=GEMINI_MODEL_NAME,
-                    contents=formatted_prompt
-                )
-                request_count += 1
-                response_text = response.text.strip()
-                
-                # Clean up the response text to ensure it is valid JSON
-                json_start = response_text.find('{')
-                json_end = response_text.rfind('}') + 1
-                
-                if json_start >= 0 and json_end > json_start:
-                    clean_json = response_text[json_start:json_end]
-                    print("Parsed JSON: " + clean_json + "\n")
-                    result = json.loads(clean_json)
-                    results.append(result["SCORE"] == "PASS")
-                else:
-                    print("Failed to extract JSON from response: " + response_text)
-                    results.append(False)
-            except Exception as e:
-                print(f"Error during hallucination check: {e}")
-                print(f"Response text: {response_text if 'response_text' in locals() else 'Not available'}")
-                # Default to False (fail) if there's an error
-                results.append(False)
-    
-    return sum(results) / len(results) if results else 0
+            ))
+    return prompts
+
+def parse_verdict(response_text):
+    if response_text is None:
+        return False
+
+    try:
+        result = json.loads(response_text)
+        print("Parsed JSON: " + response_text + "\n")
+        return result["SCORE"] == "PASS"
+    except Exception as e:
+        print(f"Error during hallucination check: {e}")
+        print(f"Response text: {response_text}")
+        return False
+
+def run_batch_job(prompts):
+    # All prompts are sent as one batch job instead of one rate limited request each
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", encoding="utf-8", delete=False) as file:
+        for i, prompt in enumerate(prompts):
+            request = {
+                "contents": [{"parts": [{"text": prompt}], "role": "user"}],
+                "generation_config": HALLU_BATCH_GENERATION_CONFIG
+            }
+            file.write(json.dumps({"key": f"sum_{i}", "request": request}) + "\n")
+    try:
+        uploaded = gemini_client.files.upload(
+            file=file.name,
+            config=types.UploadFileConfig(display_name="hallucination-checks", mime_type="jsonl")
+        )
+    finally:
+        os.remove(file.name)
+
+    batch_job = gemini_client.batches.create(
+        model=GEMINI_MODEL_NAME,
+        src=uploaded.name,
+        config={"display_name": "hallucination-checks"}
+    )
+    while batch_job.state.name not in BATCH_DONE_STATES:
+        print(f"Batch job {batch_job.name} is {batch_job.state.name}. Waiting for {BATCH_POLL_INTERVAL} seconds.")
+        time.sleep(BATCH_POLL_INTERVAL)
+        batch_job = gemini_client.batches.get(name=batch_job.name)
+
+    if batch_job.state.name != "JOB_STATE_SUCCEEDED":
+        print(f"Batch job {batch_job.name} ended with {batch_job.state.name}: {batch_job.error}")
+        return [None] * len(prompts)
+
+    # Results are not guaranteed to be in input order, they are matched back by key
+    texts = {}
+    output = gemini_client.files.download(file=batch_job.dest.file_name).decode("utf-8")
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        if "response" not in item:
+            print(f"Error during hallucination check {item.get('key')}: {item.get('error')}")
+            continue
+        parts = item["response"]["candidates"][0]["content"]["parts"]
+        texts[item["key"]] = "".join(part.get("text", "") for part in parts).strip()
+    return [texts.get(f"sum_{i}") for i in range(len(prompts))]
+
+def retry_delay(error, attempt):
+    headers = getattr(error.response, "headers", None) or {}
+    retry_after = headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return int(retry_after)
+    return BACKOFF_BASE * 2 ** attempt + random.uniform(0, BACKOFF_JITTER)
+
+async def run_rate_limited(prompts):
+    # Requests start 60 / MAX_REQUESTS_PER_MINUTE seconds apart and run concurrently,
+    # so the rate limit is used fully instead of bursting and then sleeping for a minute
+    interval = 60 / MAX_REQUESTS_PER_MINUTE
+    semaphore = asyncio.Semaphore(MAX_REQUESTS_PER_MINUTE)
+    slot_lock = asyncio.Lock()
+    next_slot = [time.monotonic()]
+
+    async def wait_for_slot():
+        async with slot_lock:
+            now = time.monotonic()
+            slot = max(now, next_slot[0])
+            next_slot[0] = slot + interval
+        await asyncio.sleep(slot - now)
+
+    def back_off(delay):
+        # A 429 delays the next slot of every request, not only the rejected one
+        next_slot[0] = max(next_slot[0], time.monotonic() + delay)
+
+    async def run(prompt):
+        async with semaphore:
+            for attempt in range(MAX_ATTEMPTS):
+                await wait_for_slot()
+                try:
+                    response = await gemini_client.aio.models.generate_content(
+                        model=GEMINI_MODEL_NAME,
+                        contents=prompt,
+                        config=HALLU_CONFIG
+                    )
+                    # The SDK parses the structured output into HalluResult
+                    if response.parsed is not None:
+                        return response.parsed.SCORE == "PASS"
+                    return parse_verdict(response.text)
+                except errors.APIError as e:
+                    if e.code != 429 or attempt == MAX_ATTEMPTS - 1:
+                        print(f"Error during hallucination check: {e}")
+                        return None
+                    delay = retry_delay(e, attempt)
+                    print(f"Rate limit reached. Retrying in {delay:.1f} seconds.")
+                    back_off(delay)
+                except Exception as e:
+                    print(f"Error during hallucination check: {e}")
+                    return None
+
+    return await asyncio.gather(*(run(prompt) for prompt in prompts))
+
+def open_verdict_cache():
+    dir = os.path.dirname(os.path.abspath(__file__))
+    connection = sqlite3.connect(os.path.join(dir, VERDICT_CACHE_PATH))
+    connection.execute("CREATE TABLE IF NOT EXISTS verdict (key TEXT PRIMARY KEY, pass INTEGER)")
+    return connection
+
+def prompt_key(prompt):
+    # The prompt contains the content and the summary, so changing either invalidates the verdict,
+    # and verdicts of another model are not reused
+    return hashlib.sha1(f"{GEMINI_MODEL_NAME}\n{prompt}".encode("utf-8")).hexdigest()
+
+def load_verdicts(cache, keys):
+    verdicts = {}
+    for key in set(keys):
+        row = cache.execute("SELECT pass FROM verdict WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            verdicts[key] = bool(row[0])
+    return verdicts
+
+def store_verdicts(cache, verdicts):
+    cache.executemany(
+        "INSERT OR REPLACE INTO verdict (key, pass) VALUES (?, ?)",
+        [(key, int(verdict)) for key, verdict in verdicts.items()]
+    )
+
+def run_checks(prompts):
+    # Verdict of each prompt, None for checks without a response
+    if USE_BATCH_API:
+        return [parse_verdict(text) if text is not None else None for text in run_batch_job(prompts)]
+    return asyncio.run(run_rate_limited(prompts))
+
+def calculate_hallucination_scores(summaries, contents):
+    prompts = build_hallucination_prompts(summaries, contents)
+    if not prompts:
+        return 0
+
+    keys = [prompt_key(prompt) for prompt in prompts]
+    with closing(open_verdict_cache()) as cache, cache:
+        verdicts = load_verdicts(cache, keys)
+        missing = {key: prompt for key, prompt in zip(keys, prompts) if key not in verdicts}
+        print(f"{len(prompts) - len(missing)} hallucination checks cached, {len(missing)} to run.")
+
+        if missing:
+            # Checks without a response are not cached, so they are retried on the next run
+            new_verdicts = {
+                key: verdict for key, verdict in zip(missing, run_checks(list(missing.values())))
+                if verdict is not None
+            }
+            verdicts.update(new_verdicts)
+            store_verdicts(cache, new_verdicts)
+
+    # Default to False (fail) for checks without a response
+    results = [verdicts.get(key, False) for key in keys]
+    return sum(results) / len(results)
 
 def generate_results(bert_results, rouge_results, hallucination_results):
     results = {
@@ -157,7 +394,7 @@ def generate_results(bert_results, rouge_results, hallucination_results):
         }
         
         results["average_scores"][model]["rouge_score"] = {
-            f"avg_{metric}": sum(scores)/len(scores)
+            f"avg_{metric}": float(scores.mean())
             for metric, scores in rouge_results[model].items()
         }
         
@@ -166,20 +403,22 @@ def generate_results(bert_results, rouge_results, hallucination_results):
     return results
 
 if __name__ == "__main__":
-    data = read_json("data/summaries.json")
-    
     # Extract data
-    mistral_summs, llama2_summs, refs, contents = extract_data(data)
-    
-    # Calculate BERT and ROUGE scores
-    bert_mistral = calculate_bert_scores(mistral_summs, refs)
-    bert_llama2 = calculate_bert_scores(llama2_summs, refs)
-    rouge_mistral = calculate_rouge_scores(mistral_summs, refs)
-    rouge_llama2 = calculate_rouge_scores(llama2_summs, refs)
+    mistral_summs, llama2_summs, refs, contents = iter_extract("data/summaries.json")
     
-    # Calculate hallucination scores
-    hallucination_mistral = calculate_hallucination_scores(mistral_summs, contents)
-    hallucination_llama2 = calculate_hallucination_scores(llama2_summs, contents)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # BERT scores are computed in the background while the hallucination checks wait on the API
+        bert_future = executor.submit(calculate_bert_scores, [mistral_summs, llama2_summs], refs)
+
+        # Calculate ROUGE scores
+        rouge_mistral = calculate_rouge_scores(mistral_summs, refs)
+        rouge_llama2 = calculate_rouge_scores(llama2_summs, refs)
+
+        # Calculate hallucination scores
+        hallucination_mistral = calculate_hallucination_scores(mistral_summs, contents)
+        hallucination_llama2 = calculate_hallucination_scores(llama2_summs, contents)
+
+        bert_mistral, bert_llama2 = bert_future.result()
     
     # Generate final results
     results = generate_results(
@@ -1,15 +1,61 @@
 import pytest
 import requests
 from license_checker import LicenseDetector
+from license_checker.data_extractor import DataExtractor
+from license_checker import license_identifier
 from license_checker.license_identifier import LicenseIdentifier
+from license_checker.models.gemini import Gemini
+from license_checker.parameters import MAX_PAGE_BYTES
+from license_checker.request_manager import RequestManager
 from test_utils import read_urls
+from types import SimpleNamespace
+from unittest import mock
 import time
 
-def test_license_detector_implementation():
+@pytest.fixture(scope="session")
+def detector():
+    """LicenseDetector shared by the tests that do not change its settings."""
+    return LicenseDetector()
+
+# Websites crawled by the detection tests, scanned together in one batch
+WEBSITE_DATA_FILES = [
+    "data/direct_license_websites.json",
+    "data/license_mentions_websites.json",
+    "data/license_types_websites.json",
+]
+
+@pytest.fixture(scope="session")
+def batch_scan():
+    """Scan every test website in one batch, returning the results and the finish time of each site by URL."""
+    # A cold detector of its own, so the timing never includes results cached by other tests
+    detector = LicenseDetector()
+    urls = list(dict.fromkeys(
+        website_data["website"] for file_path in WEBSITE_DATA_FILES for website_data in read_urls(file_path)
+    ))
+
+    # Seconds from the start of the batch until each site finished, the last one is the total scan time
+    results, finished = {}, {}
+    start_time = time.time()
+    for result in detector.scan_websites_iter(urls):
+        results[result["website"]] = result
+        finished[result["website"]] = time.time() - start_time
+
+    return results, finished
+
+@pytest.fixture(scope="session")
+def all_results(batch_scan):
+    """Scan results of all test websites by URL."""
+    return batch_scan[0]
+
+@pytest.fixture(scope="session")
+def identifier():
+    """LicenseIdentifier shared by the parametrized identifier tests."""
+    return LicenseIdentifier()
+
+def test_license_detector_implementation(detector):
     """Test that the LicenseDetector correctly processes websites and returns structured results."""
     test_url = "https://en.wikipedia.org/"
     
-    detector = LicenseDetector()
     results = detector.scan_websites([test_url])
     
     assert len(results) == 1
@@ -31,6 +77,57 @@ def test_user_agent_set_correctly(requests_mock):
     
     assert requests_mock.last_request.headers["User-Agent"] == custom_ua
 
+def test_conditional_request_reuses_cached_page(requests_mock):
+    test_url = "http://example.com/terms"
+    request_manager = RequestManager(None)
+
+    requests_mock.get(test_url, content=b"<p>Terms</p>", headers={"ETag": '"v1"'})
+    first = request_manager.fetch_page(test_url)
+
+    requests_mock.get(test_url, status_code=304)
+    second = request_manager.fetch_page(test_url)
+
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert first == second == b"<p>Terms</p>"
+
+def test_conditional_request_cache_bounded_by_bytes(requests_mock):
+    request_manager = RequestManager(None, page_cache_bytes=10)
+    for index in range(3):
+        requests_mock.get(f"http://example.com/{index}", content=b"x" * 4, headers={"ETag": f'"v{index}"'})
+        request_manager.fetch_page(f"http://example.com/{index}")
+
+    assert list(request_manager.page_cache) == ["http://example.com/1", "http://example.com/2"]
+    assert request_manager.page_cache_used == 8
+
+def test_robots_txt_fetched_once_per_host(requests_mock):
+    request_manager = RequestManager(None)
+    robots = requests_mock.get("http://example.com/robots.txt", text="User-agent: *\nDisallow: /private")
+
+    allowed = request_manager.is_allowed_by_robots("http://example.com/terms")
+    blocked = request_manager.is_allowed_by_robots("http://example.com/private")
+
+    assert allowed is True
+    assert blocked is False
+    assert robots.call_count == 1
+
+def test_fetch_page_truncates_large_pages(requests_mock):
+    request_manager = RequestManager(None)
+    requests_mock.get("http://example.com/huge", content=b"x" * (MAX_PAGE_BYTES + 1000))
+
+    page = request_manager.fetch_page("http://example.com/huge")
+
+    assert page == b"x" * MAX_PAGE_BYTES
+
+def test_footer_links_match_each_keyword():
+    extractor = DataExtractor(None)
+    soup = extractor.parse_html(
+        '<footer><a href="/use">Acceptable Use</a><a href="/licensing">Licensing</a><a href="/about">About</a></footer>'
+    )
+
+    _, _, relevant_links = extractor.extract_footer_links(soup, "http://example.com")
+
+    assert relevant_links == ["http://example.com/use", "http://example.com/licensing"]
+
 def test_blocked_by_robots_txt():
     test_url = "https://en.wikipedia.org/"
     
@@ -44,14 +141,22 @@ def test_blocked_by_robots_txt():
     assert res[0].get("blockedByRobotsTxt") is False
 
 @pytest.mark.parametrize("website_data", read_urls("data/invalid_urls.json"))
-def test_invalid_urls(website_data):
+def test_invalid_urls(website_data, detector):
     test_url = website_data["website"]
 
-    detector = LicenseDetector()
     res = detector.scan_websites([test_url])
 
     assert res[0].get("invalidUrl") is True
 
+def test_scan_websites_iter_yields_every_invalid_url(detector):
+    """Test that the streaming scan yields one result per website."""
+    test_urls = [website_data["website"] for website_data in read_urls("data/invalid_urls.json")]
+
+    res = list(detector.scan_websites_iter(test_urls))
+
+    assert sorted(r["website"] for r in res) == sorted(test_urls)
+    assert all(r.get("invalidUrl") is True for r in res)
+
 # AI generated test cases: https://gemini.google.com/app/fd1ab97fa81a4aa9
 @pytest.mark.parametrize("license_text, expected_type", [
     # Creative Commons (CC) - Examples showing different versions and types (BY, SA, ND, NC, etc.)
@@ -114,9 +219,8 @@ def test_invalid_urls(website_data):
     ("Requires copyright notice preservation under the 2-clause BSD license.", "BSD License"),
     ("Project relicensed from 4-clause BSD to the more common 3-clause BSD license.", "BSD License"),
 ])
-def test_license_identifier_extract_licenses(license_text, expected_type):
+def test_license_identifier_extract_licenses(license_text, expected_type, identifier):
     """Test the LicenseIdentifier can correctly extract license mentions from text."""
-    identifier = LicenseIdentifier()
     print(f"Testing with text: {license_text}")
     
     license_mentions = identifier.extract_licenses(license_text)
@@ -189,9 +293,8 @@ def test_license_identifier_extract_licenses(license_text, expected_type):
     ("Source code access is granted under specific conditions.", "BSD License"),
     ("The Berkeley Software Distribution influenced many systems.", "BSD License"), # Historical/contextual mention
 ])
-def test_license_identifier_false_positives(license_text, expected_type):
+def test_license_identifier_false_positives(license_text, expected_type, identifier):
     """Test the LicenseIdentifier does not incorrectly identify false positives."""
-    identifier = LicenseIdentifier()
     print(f"Testing with text: {license_text}")
     
     license_mentions = identifier.extract_licenses(license_text)
@@ -199,32 +302,95 @@ def test_license_identifier_false_positives(license_text, expected_type):
     assert isinstance(license_mentions, list)
     assert len(license_mentions) == 0, f"Expected no license mentions, but found: {license_mentions}"
 
+@pytest.mark.parametrize("license_text", [
+    "CC " + "BY-" * 20000 + "x",
+    "CC " + "BY" * 20000 + "x",
+    "CC" + " -" * 20000 + "x",
+    "Creative Commons " + "Attribution - " * 10000 + "_",
+    ("CC " + "NC" * 100 + "x ") * 200,
+], ids=["separated", "unseparated", "separators-only", "long-name", "many-starts"])
+def test_license_identifier_adversarial_cc_text(license_text, identifier):
+    """Test that long runs of CC attributes are matched without catastrophic backtracking."""
+
+    start_time = time.time()
+    identifier.extract_licenses(license_text)
+    identifier.determine_cc_license("", license_text)
+
+    assert time.time() - start_time < 1, "Matching CC attributes took too long"
+
+def test_license_identifier_cached_results():
+    """Test that cached results match fresh ones and are not shared between calls."""
+    identifier = LicenseIdentifier()
+    text = "Released under the MIT License and CC BY-SA 4.0."
+
+    first = identifier.extract_licenses(text)
+    first.append("Mutated")
+    second = identifier.extract_licenses(text)
+
+    assert second == ["Creative Commons (CC)", "MIT License"]
+    assert identifier.determine_cc_license("", text) == identifier.determine_cc_license("", text) == "CC-BY-SA-4.0"
+    assert identifier.determine_cc_license("", text.replace("SA", "ND")) == "CC-BY-ND-4.0"
+
+def test_license_identifier_skips_text_without_trigger_words(monkeypatch):
+    """Test that ToS text with words like 'submit' or 'account' but no license skips the license patterns."""
+    identifier = LicenseIdentifier()
+    mentions_pattern = mock.Mock(wraps=license_identifier.LICENSE_MENTIONS_PATTERN)
+    monkeypatch.setattr(license_identifier, "LICENSE_MENTIONS_PATTERN", mentions_pattern)
+    tos_text = (
+        "By accessing the Service you accept these Terms and are responsible for your account. "
+        "You must not submit content without permission, and we may limit or terminate access. "
+        "You commit to comply with applicable regulations described in our privacy policy."
+    )
+
+    assert identifier.extract_licenses(tos_text) == []
+    assert identifier.determine_cc_license("", tos_text) == "Unknown"
+    mentions_pattern.finditer.assert_not_called()
+
+    assert identifier.extract_licenses(tos_text + " Code is released under the MIT License.") == ["MIT License"]
+    mentions_pattern.finditer.assert_called_once()
+
+@pytest.mark.parametrize("responses, expected", [
+    (["A1: Under CC BY-SA.\nA2: Yes."], ["Under CC BY-SA.", "Yes."]),
+    (["A2: Yes.\nA1: Under CC BY-SA."], ["Under CC BY-SA.", "Yes."]),
+    (["A1: Under CC BY-SA.", "First answer", "Second answer"], ["First answer", "Second answer"]),
+    (["A1: Under CC BY-SA.\nA1: Yes.", "First answer", "Second answer"], ["First answer", "Second answer"]),
+], ids=["ordered", "reordered", "missing", "duplicated"])
+def test_answer_questions_splits_numbered_answers(responses, expected):
+    """Test that numbered answers are matched to their questions, falling back to separate requests."""
+    responses = iter(responses)
+    model = Gemini(api_key="test-key")
+    model._client = SimpleNamespace(models=SimpleNamespace(
+        generate_content=lambda model, contents: SimpleNamespace(text=next(responses))
+    ))
+    model._client_key = model.api_key
+
+    answers = model.answer_questions({"summary": "Content is under CC BY-SA."}, ["Which license?", "Can I share it?"])
+
+    assert answers == expected
+
 @pytest.mark.parametrize("website_data", read_urls("data/direct_license_websites.json"))
-def test_direct_license_detection(website_data):
+def test_direct_license_detection(website_data, all_results):
     test_url = website_data["website"]
     expected_license_link = website_data["expected"]
 
-    detector = LicenseDetector()
-    res = detector.scan_websites([test_url])
+    res = all_results[test_url]
 
-    assert res[0].get("licenseLink") == expected_license_link[0], "License link mismatch"
-    assert res[0].get("licenseType") == expected_license_link[1], "License type mismatch"
+    assert res.get("licenseLink") == expected_license_link[0], "License link mismatch"
+    assert res.get("licenseType") == expected_license_link[1], "License type mismatch"
 
 @pytest.mark.parametrize("website_data", read_urls("data/license_mentions_websites.json"))
-def test_license_mentions_in_text(website_data):
-    _test_website_data(website_data, "licenseMentions")
+def test_license_mentions_in_text(website_data, all_results):
+    _test_website_data(website_data, "licenseMentions", all_results)
 
 @pytest.mark.parametrize("website_data", read_urls("data/license_types_websites.json"))
-def test_license_types_in_text(website_data):
-    _test_website_data(website_data, "licenseType")
+def test_license_types_in_text(website_data, all_results):
+    _test_website_data(website_data, "licenseType", all_results)
 
-def _test_website_data(website_data, result_key):
+def _test_website_data(website_data, result_key, all_results):
     test_url = website_data["website"]
     expected_items = website_data["expected"]
 
-    detector = LicenseDetector()
-    result = detector.scan_websites([test_url])
-    actual_items = result[0].get(result_key)
+    actual_items = all_results[test_url].get(result_key)
     if isinstance(actual_items, str):
         actual_items = [actual_items]
 
@@ -233,25 +399,17 @@ def _test_website_data(website_data, result_key):
 
 
 
-def test_processing_time_performance():
+def test_processing_time_performance(batch_scan):
     """Test that the average processing time of websites is less than or equal to 5 seconds."""
-    direct_license_sites = read_urls("data/direct_license_websites.json")
-    license_mentions_sites = read_urls("data/license_mentions_websites.json")
-    
-    all_sites = direct_license_sites + license_mentions_sites
-    
-    detector = LicenseDetector()
-    
-    urls = [site["website"] for site in all_sites]
-    
-    start_time = time.time()
-    detector.scan_websites(urls)
-    end_time = time.time()
-    
-    total_time = end_time - start_time
-    avg_time_per_site = total_time / len(urls)
+    results, finished = batch_scan
+    last_url = max(finished, key=finished.get)
+    total_time = finished[last_url]
+    avg_time_per_site = total_time / len(results)
     
     print(f"Average processing time per site: {avg_time_per_site:.2f} seconds")
-    print(f"Total time for {len(urls)} sites: {total_time:.2f} seconds")
+    print(f"Total time for {len(results)} sites: {total_time:.2f} seconds")
     
-    assert avg_time_per_site <= 5, f"Average processing time per site ({avg_time_per_site:.2f}s) exceeds 5 seconds"
\ No newline at end of file
+    assert avg_time_per_site <= 5, (
+        f"Average processing time per site ({avg_time_per_site:.2f}s) exceeds 5 seconds, "
+        f"slowest site: {last_url} (finished after {total_time:.2f}s)"
+    )
\ No newline at end of file
@@ -1,17 +1,40 @@
+from functools import lru_cache
+import copy
 import json
 import os
 
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(data):
+        return json.dumps(data, indent=2).encode("utf-8")
+
 
 def read_urls(file_path):
     dir = os.path.dirname(os.path.abspath(__file__))
     full_file_path = os.path.join(dir, file_path)
     
-    with open(full_file_path, "r", encoding="utf-8") as file:
-        return json.load(file)
+    # Every caller gets its own copy, so mutating it cannot affect later tests
+    return copy.deepcopy(_read_json(full_file_path))
+
+# Data files are parsed once even when several tests are parametrized by them
+@lru_cache(maxsize=None)
+def _read_json(full_file_path):
+    with open(full_file_path, "rb") as file:
+        return _loads(file.read())
 
 def write_json(file_path, data):
     dir = os.path.dirname(os.path.abspath(__file__))
     full_file_path = os.path.join(dir, file_path)
 
-    with open(full_file_path, "w", encoding="utf-8") as file:
-        json.dump(data, file, indent=4)
\ No newline at end of file
+    # Written to a temporary file first, so an interrupted run never leaves a truncated file
+    tmp_file_path = full_file_path + ".tmp"
+    with open(tmp_file_path, "wb") as file:
+        file.write(_dumps(data))
+    os.replace(tmp_file_path, full_file_path)
\ No newline at end of file